@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Lookup latency of the in-memory VehicleCatalog against the same ranked
+lookup in DuckDB (model_match.rank_models), plus the catalog's footprint.
+
+    python benchmarks/catalog_lookup.py
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from auto_mechanic_agent.tools.catalog import vehicle_catalog  # noqa: E402
+from auto_mechanic_agent.tools.manifest_db import manifest_pool  # noqa: E402
+from auto_mechanic_agent.tools.model_match import rank_models  # noqa: E402
+
+
+def percentiles(fn, params):
+    lat = []
+    for p in params:
+        start = time.perf_counter()
+        fn(*p)
+        lat.append(time.perf_counter() - start)
+    lat.sort()
+    return lat[len(lat) // 2] * 1e6, lat[int(len(lat) * 0.99)] * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--lookups", type=int, default=1000)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    catalog = vehicle_catalog()
+    load = time.perf_counter() - start
+
+    with manifest_pool().cursor() as cur:
+        params = cur.execute(f"""
+            SELECT make::TEXT, split_part(base_model, ' ', 1), year::TEXT
+              FROM manifest USING SAMPLE reservoir({args.lookups} ROWS) REPEATABLE (0)
+        """).fetchall()
+
+    print(f"\ncatalog: {len(catalog)} rows, {len(catalog.makes)} makes, "
+          f"{catalog.memory_bytes() / 2**20:.1f} MiB, loaded in {load * 1e3:.0f} ms")
+    print(f"{'':<8} {'p50 us':>9} {'p99 us':>9}")
+    for label, fn in (("duckdb", rank_models), ("catalog", catalog.rank)):
+        p50, p99 = percentiles(fn, params)
+        print(f"{label:<8} {p50:>9.1f} {p99:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
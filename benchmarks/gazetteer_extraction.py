@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Extraction latency of the vehicle gazetteer, plus regression phrasings it
+must keep resolving (or keep refusing to guess at).
+
+    python benchmarks/gazetteer_extraction.py
+
+Exits non-zero when a phrasing no longer gives the expected best match:
+a (make, model, year) that reaches HIGH_CONFIDENCE, or None for text whose
+vehicle must be left to the LLM.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from auto_mechanic_agent.tools.gazetteer import vehicle_gazetteer  # noqa: E402
+
+CASES = [
+    ("My 2002 Honda Civic is making a strange noise when I accelerate.",
+     ("Honda", "civic", 2002)),
+    ("brakes squeal on my '99 Camry", ("Toyota", "camry", 1999)),
+    ("2004 F-150 won't start", ("Ford", "f 150", 2004)),
+    ("Chevy Silverado 2005 transmission slipping", ("Chevrolet", "silverado", 2005)),
+    ("my dodge ram 1500 from 2003 overheats", ("Dodge and Ram", "ram 1500", 2003)),
+    ("my 2006 mazda 6 stalls", ("Mazda", "6", 2006)),
+    # two vehicles, or two years a vehicle was sold in, are left to the LLM
+    ("my 2002 Honda Civic and my 2006 Toyota Camry", None),
+    ("my 2006 Toyota Camry and my 2002 Honda Civic", None),
+    ("My 2005 Honda Accord, bought it in 2010, pulls left", None),
+    # engine speeds and mileages are not model years
+    ("My 2005 Honda Accord, 2000 rpm vibration", ("Honda", "accord", 2005)),
+    ("Honda Accord 2010 miles since oil change, it's a 2005", ("Honda", "accord", 2005)),
+    ("My Honda Civic shudders at 2000 rpm", None),
+    # bare numbers and everyday words never name a vehicle on their own
+    ("I have 5 kids and a 2006 minivan that stalls", None),
+    ("Bought it in 2008, the 6 cylinder misfires", None),
+    ("My 2004 truck with 4 wheel drive grinds", None),
+    ("my 2002 car is making a grinding noise and the light is on", None),
+    ("2007 spark plugs misfire and the fuel pump relay clicks", None),
+]
+
+# Per-candidate checks that the best match alone doesn't show: each vehicle
+# takes the year mentioned right before it
+CANDIDATES = [
+    ("my 2002 Honda Civic and my 2006 Toyota Camry", ("Honda", "civic", 2002)),
+    ("my 2002 Honda Civic and my 2006 Toyota Camry", ("Toyota", "camry", 2006)),
+    ("my 2006 Toyota Camry and my 2002 Honda Civic", ("Honda", "civic", 2002)),
+    ("my 2006 Toyota Camry and my 2002 Honda Civic", ("Toyota", "camry", 2006)),
+    ("My Honda Civic shudders at 2000 rpm", ("Honda", "civic", None)),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200, help="extractions per phrasing")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    gazetteer = vehicle_gazetteer()
+    print(f"build: {(time.perf_counter() - start) * 1e3:.0f} ms")
+
+    failed = False
+    for text, expected in CASES:
+        best = gazetteer.best(text)
+        got = (best["make"], best["model"], best["year"]) if best else None
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            gazetteer.extract(text)
+        us = (time.perf_counter() - start) / args.repeat * 1e6
+        ok = got == expected
+        failed |= not ok
+        print(f"{us:8.0f} µs  {'ok  ' if ok else 'FAIL'}  {text!r} -> {got}"
+              + ("" if ok else f" (expected {expected})"))
+
+    for text, expected in CANDIDATES:
+        found = [(c["make"], c["model"], c["year"]) for c in gazetteer.extract(text)]
+        ok = expected in found
+        failed |= not ok
+        print(f"{'':>11}  {'ok  ' if ok else 'FAIL'}  {text!r} has {expected}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Cold import time of each tool module, measured with `python -X importtime`
+in a fresh interpreter, and a guard against heavy imports creeping back in.
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --budget-ms 150 auto_mechanic_agent.tools.catalog
+
+Exits non-zero when a module pulls in one of the deferred dependencies
+(OpenAI, ReportLab, requests, DuckDB) at import time, exceeds the budget,
+or fails to import. Dependencies that `import crewai.tools` already loads
+on its own (openai and requests come in through litellm) are not counted
+against the modules built on it.
+"""
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+MODULES = [
+    "auto_mechanic_agent.tools.custom_tool",
+    "auto_mechanic_agent.tools.query_manifest",
+    "auto_mechanic_agent.tools.pdf_creator",
+    "auto_mechanic_agent.tools.image_gen",
+    "auto_mechanic_agent.tools.catalog",
+    "auto_mechanic_agent.tools.fleet_lookup",
+    "auto_mechanic_agent.tools.model_match",
+    "auto_mechanic_agent.tools.autocomplete",
+    "auto_mechanic_agent.tools.aliases",
+    "auto_mechanic_agent.tools.vin",
+    "auto_mechanic_agent.tools.model_family",
+    "auto_mechanic_agent.tools.gazetteer",
+    "auto_mechanic_agent.tools.spelling",
+]
+
+# Loaded on first use only; none of them may appear in an import trace
+DEFERRED = ("openai", "reportlab", "requests", "duckdb")
+
+# What the tools' base classes import by themselves, outside this package
+BASELINE = "crewai.tools"
+
+
+def import_trace(module: str):
+    """{module: cumulative µs} for one cold `import module`, or an error string."""
+    env = dict(os.environ, PYTHONPATH=str(ROOT / "src"))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=env,
+    )
+    if proc.returncode:
+        return proc.stderr.strip().splitlines()[-1]
+
+    trace = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            trace[name.strip()] = int(cumulative)
+    return trace
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=MODULES)
+    parser.add_argument("--repeat", type=int, default=5, help="runs per module; best is kept")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="fail when a module's cumulative import exceeds this")
+    args = parser.parse_args()
+
+    baseline = import_trace(BASELINE)
+    inherited = set(DEFERRED) & set(baseline) if isinstance(baseline, dict) else set()
+
+    failed = False
+    print(f"{'module':<44}{'import ms':>10}  notes")
+    for module in args.modules:
+        best = None
+        for _ in range(args.repeat):
+            trace = import_trace(module)
+            if isinstance(trace, str):
+                best = trace
+                break
+            if best is None or trace.get(module, 0) < best.get(module, 0):
+                best = trace
+
+        if isinstance(best, str):
+            print(f"{module:<44}{'-':>10}  error: {best}")
+            failed = True
+            continue
+
+        ms = best.get(module, 0) / 1000
+        notes = [f"imports {name}" for name in DEFERRED
+                 if name in best and not (name in inherited and BASELINE in best)]
+        if args.budget_ms is not None and ms > args.budget_ms:
+            notes.append(f"over budget ({args.budget_ms:g} ms)")
+        failed |= bool(notes)
+        print(f"{module:<44}{ms:>10.1f}  {', '.join(notes) or 'ok'}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
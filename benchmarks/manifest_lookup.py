@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Lookup latency of an exact (make, year, model) query in DuckDB, before and
+after the typed, sorted and indexed manifest build, on a manifest scaled up
+N times. QueryManifestTool itself now answers from the in-memory catalog;
+see catalog_lookup.py for that path.
+
+    python benchmarks/manifest_lookup.py --scale 100
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import duckdb
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from vehicle_knowledge_source import CSV_PATH, setup_database  # noqa: E402
+
+# The original per-call query over an all-TEXT, unindexed manifest
+BEFORE_SQL = """
+    SELECT bundle_url FROM manifest
+     WHERE make = ? AND model ILIKE '%' || ? || '%' AND year = ?
+     LIMIT 1
+"""
+
+# The same lookup on the indexed-SQL path: typed columns and model_key
+AFTER_SQL = """
+    SELECT bundle_url FROM manifest
+     WHERE make = TRY_CAST(? AS make_name)
+       AND year = TRY_CAST(? AS INTEGER)
+       AND contains(model_key, ?)
+     LIMIT 1
+"""
+
+
+def scaled_csv(csv_path: Path, out: Path, scale: int):
+    """Write `scale` copies of the manifest, each under its own host name."""
+    duckdb.execute(f"""
+        COPY (
+            SELECT make, model, year,
+                   replace(bundle_url, '://', '://c' || i || '.') AS bundle_url
+              FROM read_csv(?, header = true, all_varchar = true), range({scale}) t(i)
+        ) TO '{out}' (HEADER)
+    """, [str(csv_path)])
+
+
+def percentiles(conn, sql, params):
+    lat = []
+    for p in params:
+        start = time.perf_counter()
+        conn.execute(sql, p).fetchall()
+        lat.append(time.perf_counter() - start)
+    lat.sort()
+    return lat[len(lat) // 2] * 1e3, lat[int(len(lat) * 0.99)] * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scale", type=int, default=100, help="copies of the manifest")
+    parser.add_argument("--lookups", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        csv_path = tmp / "manifest.csv"
+        scaled_csv(CSV_PATH, csv_path, args.scale)
+
+        before = duckdb.connect(str(tmp / "before.duckdb"))
+        before.execute("CREATE TABLE manifest AS SELECT * FROM "
+                       "read_csv(?, header = true, all_varchar = true)", [str(csv_path)])
+        rows = before.execute("SELECT count(*) FROM manifest").fetchone()[0]
+
+        setup_database(csv_path, tmp / "after.duckdb")
+        after = duckdb.connect(str(tmp / "after.duckdb"), read_only=True)
+
+        sample = after.execute(f"""
+            SELECT make::TEXT, year::TEXT, split_part(base_model, ' ', 1)
+              FROM manifest USING SAMPLE reservoir({args.lookups} ROWS) REPEATABLE (0)
+        """).fetchall()
+        before_params = [(make, model, year) for make, year, model in sample]
+        after_params = [(make, year, model.lower()) for make, year, model in sample]
+
+        print(f"\n{rows} rows, {len(sample)} lookups")
+        print(f"{'':<8} {'p50 ms':>8} {'p99 ms':>8}")
+        for label, conn, sql, params in (("before", before, BEFORE_SQL, before_params),
+                                         ("after", after, AFTER_SQL, after_params)):
+            p50, p99 = percentiles(conn, sql, params)
+            print(f"{label:<8} {p50:>8.3f} {p99:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,32 @@
 #!/usr/bin/env python3
+import argparse
+import asyncio
 import csv
+import json
+import sqlite3
 import time
+import zlib
+from dataclasses import dataclass
 import logging
+import re
 import requests
 from bs4 import BeautifulSoup
-from urllib.parse import quote
+from urllib.parse import quote, urlsplit
 from pathlib import Path
+from typing import Any, Callable
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 
 # ─── CONFIG ──────────────────────────────────────────────────────────────────
 BASE_URL      = "https://charm.li"
 OUTPUT_CSV    = "charm_manifest.csv"
+JOURNAL       = "charm_manifest.journal"   # finished units, for resuming a crawl
+CACHE         = "charm_cache.sqlite"       # validators and bodies, for conditional GETs
+PARSER        = 1      # bump when a page parser's output changes; cached parses are redone
 HEADERS       = {"User-Agent": "Mozilla/5.0"}
-THROTTLE      = 0.3    # seconds between requests
+CONCURRENCY   = 16     # requests in flight at once
+RATE          = 1 / 0.3  # requests per second, per host: the old crawl's 0.3 s THROTTLE
+BURST         = 1      # requests a host may receive back to back
 YEAR_START    = 1980
 YEAR_END      = 2024
 # URL-encoded list of the 49 makes from charm.li
@@ -27,30 +41,70 @@ MAKES = [
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 
-def probe_year(make: str, year: int) -> str | None:
-    """Return the /Make/Year/ URL if it gives a 200, else None."""
-    url = f"{BASE_URL}/{make}/{year}/"
-    try:
-        r = requests.get(url, headers=HEADERS, timeout=10)
-        if r.status_code == 200:
-            return url
-    except RequestException:
-        pass
-    return None
-
-def get_models_for_year(make: str, year: int, year_url: str):
+
+class TokenBucket:
     """
-    Scrape the valid /Make/Year/ page for all detail links,
-    then convert each to its /bundle/ equivalent.
+    Allows `rate` requests per second on average and up to `burst` back to
+    back; acquire() waits for a token. Waiters are served in arrival order.
     """
-    try:
-        r = requests.get(year_url, headers=HEADERS, timeout=15)
-        r.raise_for_status()
-    except RequestException as e:
-        logging.warning(f"  ✖ Couldn’t fetch {year_url}: {e}")
-        return []
 
-    soup = BeautifulSoup(r.text, "html.parser")
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = burst
+        self._tokens = float(burst)
+        self._stamp = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+                self._stamp = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+@dataclass
+class CrawlStats:
+    """Per-run counters, logged when the crawl finishes."""
+    requests: int = 0
+    bytes: int = 0
+    duplicates_avoided: int = 0
+    probed_makes: int = 0
+    resumed_units: int = 0
+    failed_units: int = 0
+    not_modified: int = 0
+
+    def __str__(self):
+        return (f"{self.requests} requests, {self.bytes / 1e6:.2f} MB downloaded, "
+                f"{self.duplicates_avoided} duplicate fetches avoided, "
+                f"{self.probed_makes} makes probed year by year, "
+                f"{self.resumed_units} units resumed from {JOURNAL}, "
+                f"{self.failed_units} units failed, "
+                f"{self.not_modified} pages unchanged (304)")
+
+
+def get_years_for_make(make: str, page: str) -> list[int]:
+    """The years a make's landing page links to (/Make/Year/), ascending."""
+    soup = BeautifulSoup(page, "html.parser")
+    pattern = re.compile(rf"/{re.escape(make)}/(\d{{4}})/?")
+    years = set()
+    for a in soup.select("a[href]"):
+        match = pattern.fullmatch(a["href"].strip())
+        if match:
+            years.add(int(match.group(1)))
+    return sorted(years)
+
+
+def get_models_for_year(make: str, year: int, page: str):
+    """
+    Scrape a /Make/Year/ page for all detail links,
+    then convert each to its /bundle/ equivalent.
+    """
+    soup = BeautifulSoup(page, "html.parser")
     prefix = f"/{make}/{year}/"
     entries = []
     for a in soup.select("a[href]"):
@@ -61,29 +115,298 @@ def get_models_for_year(make: str, year: int, year_url: str):
             entries.append((model, bundle))
     return entries
 
-def build_and_write_manifest():
-    manifest = []
-    for make in MAKES:
-        disp = quote(make, safe="%20")  # already encoded, but ensure
-        logging.info(f"→ Checking {make}")
-        time.sleep(THROTTLE)
 
-        # Probe each year
-        for year in range(YEAR_START, YEAR_END + 1):
-            year_url = probe_year(make, year)
-            if not year_url:
-                continue
+class CrawlJournal:
+    """
+    Append-only JSON-lines record of finished work: one line per make's
+    year list and one per crawled (make, year) with its rows (none for a
+    year that doesn't exist). A restarted crawl replays it and skips those
+    units. Each line is flushed as it is written, so a crash loses at most
+    the line in progress, which is ignored on reload.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.years: dict[str, list[int]] = {}
+        self.rows: dict[tuple[str, int], list[dict]] = {}
+        if self.path.exists():
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # torn final line
+                    if "rows" in entry:
+                        self.rows[entry["make"], entry["year"]] = entry["rows"]
+                    else:
+                        self.years[entry["make"]] = entry["years"]
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def __len__(self):
+        return len(self.rows)
+
+    def _append(self, entry: dict):
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.flush()
 
+    def record_years(self, make: str, years: list[int]):
+        self.years[make] = years
+        self._append({"make": make, "years": years})
+
+    def record_rows(self, make: str, year: int, rows: list[dict]):
+        self.rows[make, year] = rows
+        self._append({"make": make, "year": year, "rows": rows})
+
+    def close(self):
+        self._file.close()
+
+    def discard(self):
+        """Delete the journal once its crawl has been written out."""
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+
+class HttpCache:
+    """
+    Persistent HTTP cache for conditional re-crawls: per URL, the ETag and
+    Last-Modified validators, the zlib-compressed body and what the crawler
+    parsed out of it, tagged with the PARSER version that produced it. A 304
+    answer then reuses the parse without touching the HTML again, or
+    re-parses the cached body if the parse is missing or out of date.
+    """
+
+    def __init__(self, path: str | Path):
+        self._db = sqlite3.connect(path)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS pages (
+                url           TEXT PRIMARY KEY,
+                etag          TEXT,
+                last_modified TEXT,
+                body          BLOB,
+                parsed        TEXT,
+                parser        INTEGER
+            )
+        """)
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(pages)")}
+        if "parser" not in columns:
+            # caches written before parses were versioned; their rows read as stale
+            self._db.execute("ALTER TABLE pages ADD COLUMN parser INTEGER")
+
+    def validators(self, url: str) -> dict[str, str]:
+        """Conditional-request headers for `url`, empty if it isn't cached."""
+        row = self._db.execute("SELECT etag, last_modified FROM pages WHERE url = ?",
+                               (url,)).fetchone()
+        if row is None:
+            return {}
+        etag, last_modified = row
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def parsed(self, url: str) -> Any:
+        """What the current parser made of the cached page; None if missing or stale."""
+        row = self._db.execute("SELECT parsed FROM pages WHERE url = ? AND parser = ?",
+                               (url, PARSER)).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return json.loads(row[0])
+
+    def body(self, url: str) -> str:
+        """The cached HTML, decompressed, for re-parsing without a download."""
+        row = self._db.execute("SELECT body FROM pages WHERE url = ?", (url,)).fetchone()
+        return zlib.decompress(row[0]).decode("utf-8")
+
+    def put(self, url: str, response: requests.Response, parsed: Any):
+        """Remember a 200 response, if it carries validators to revalidate with."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not (etag or last_modified):
+            return
+        self._db.execute(
+            "INSERT OR REPLACE INTO pages (url, etag, last_modified, body, parsed, parser) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (url, etag, last_modified, zlib.compress(response.content),
+             json.dumps(parsed, ensure_ascii=False), PARSER),
+        )
+        self._db.commit()
+
+    def reparsed(self, url: str, parsed: Any):
+        """Replace the cached parse of `url`, keeping its body and validators."""
+        self._db.execute("UPDATE pages SET parsed = ?, parser = ? WHERE url = ?",
+                         (json.dumps(parsed, ensure_ascii=False), PARSER, url))
+        self._db.commit()
+
+    def close(self):
+        self._db.close()
+
+
+class Crawler:
+    """
+    Fetches pages concurrently: at most `concurrency` requests in flight,
+    and each host paced by its own token bucket. requests is blocking, so
+    each GET runs in a worker thread over one pooled session.
+    """
+
+    def __init__(self, concurrency: int = CONCURRENCY, rate: float = RATE, burst: int = BURST,
+                 journal: CrawlJournal | None = None, cache: HttpCache | None = None):
+        self.journal = journal
+        self.cache = cache
+        self.rate = rate
+        self.burst = burst
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        adapter = HTTPAdapter(pool_connections=concurrency, pool_maxsize=concurrency)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._slots = asyncio.Semaphore(concurrency)
+        self._buckets: dict[str, TokenBucket] = {}
+        self.stats = CrawlStats()
+
+    async def get(self, url: str, timeout: float,
+                  headers: dict[str, str] | None = None) -> requests.Response:
+        host = urlsplit(url).netloc
+        bucket = self._buckets.setdefault(host, TokenBucket(self.rate, self.burst))
+        async with self._slots:
+            await bucket.acquire()
+            r = await asyncio.to_thread(self.session.get, url, timeout=timeout, headers=headers)
+        self.stats.requests += 1
+        self.stats.bytes += len(r.content)
+        return r
+
+    async def fetch_page(self, url: str, parse: Callable[[str], Any]) -> Any:
+        """
+        parse() of the page at `url`, or None if it doesn't exist (404 or
+        410). Cached pages are revalidated with a conditional GET, and a 304
+        returns the cached parse, or parses the cached body again if that
+        parse is missing or came from an older PARSER. Network errors and
+        every other status (429, 5xx, ...) are raised, so the caller can
+        tell "missing" from "not fetched".
+        """
+        conditional = self.cache.validators(url) if self.cache is not None else {}
+        r = await self.get(url, timeout=15, headers=conditional)
+        if r.status_code == 304 and conditional:
+            self.stats.not_modified += 1
+            parsed = self.cache.parsed(url)
+            if parsed is None:
+                parsed = parse(self.cache.body(url))
+                self.cache.reparsed(url, parsed)
+            return parsed
+        if r.status_code in (404, 410):
+            return None
+        if r.status_code != 200:
+            raise requests.HTTPError(f"{r.status_code} {r.reason} for {url}", response=r)
+        parsed = parse(r.text)
+        if self.cache is not None:
+            self.cache.put(url, r, parsed)
+        return parsed
+
+    async def make_years(self, make: str) -> tuple[list[int], bool]:
+        """
+        The years listed on the make's charm.li page and True; every year
+        from YEAR_START to YEAR_END (each probed by crawl_year) and False if
+        that page can't be read.
+        """
+        if self.journal is not None and make in self.journal.years:
+            return self.journal.years[make], True
+        try:
+            years = await self.fetch_page(f"{BASE_URL}/{make}/",
+                                          lambda page: get_years_for_make(make, page))
+        except RequestException as e:
+            logging.warning(f"  ✖ Couldn’t fetch {BASE_URL}/{make}/: {e}")
+            years = None
+        if years:
+            if self.journal is not None:
+                self.journal.record_years(make, years)
+        else:
+            logging.warning(f"  ✖ No year list for {make}; probing {YEAR_START}–{YEAR_END}")
+            self.stats.probed_makes += 1
+            return list(range(YEAR_START, YEAR_END + 1)), False
+        return years, True
+
+    async def crawl_year(self, make: str, year: int, listed: bool = False) -> list[dict]:
+        """
+        Manifest rows for one make and year (none if the year doesn't
+        exist), journaled once known. A page that couldn't be fetched, or a
+        `listed` year (linked from the make's page) that turns out missing,
+        yields no rows and stays unjournaled, so a rerun retries it.
+        """
+        if self.journal is not None and (make, year) in self.journal.rows:
+            self.stats.resumed_units += 1
+            return self.journal.rows[make, year]
+
+        # one GET answers both "does this year exist" and "which models does it have"
+        url = f"{BASE_URL}/{make}/{year}/"
+        try:
+            entries = await self.fetch_page(url, lambda page: get_models_for_year(make, year, page))
+        except RequestException as e:
+            logging.warning(f"  ✖ Couldn’t fetch {url}: {e}")
+            self.stats.failed_units += 1
+            return []
+        if entries is None and listed:
+            logging.warning(f"  ✖ {url} is linked from the {make} page but missing")
+            self.stats.failed_units += 1
+            return []
+
+        rows = []
+        if entries is not None:
+            # the old probe-then-fetch crawl requested this page a second time
+            self.stats.duplicates_avoided += 1
             logging.info(f"  ✅ Found {make} {year}")
-            entries = get_models_for_year(make, year, year_url)
-            for model, bundle_url in entries:
-                manifest.append({
+            rows = [
+                {
                     "make": requests.utils.unquote(make),
                     "model": model,
                     "year": str(year),
                     "bundle_url": bundle_url
-                })
-            time.sleep(THROTTLE)
+                }
+                for model, bundle_url in entries
+            ]
+        if self.journal is not None:
+            self.journal.record_rows(make, year, rows)
+        return rows
+
+    async def crawl_make(self, make: str) -> list[dict]:
+        """Manifest rows for every year of one make, in year order."""
+        years, listed = await self.make_years(make)
+        manifest = []
+        for rows in await asyncio.gather(*(self.crawl_year(make, year, listed)
+                                           for year in years)):
+            manifest.extend(rows)
+        return manifest
+
+    async def crawl(self, makes: list[str] | None = None) -> list[dict]:
+        """Every make at once, rows returned in (make, year, page) order."""
+        makes = MAKES if makes is None else makes
+        logging.info(f"→ Checking {len(makes)} makes")
+        units = [
+            self.crawl_make(quote(make, safe="%20"))  # already encoded, but ensure
+            for make in makes
+        ]
+        manifest = []
+        for rows in await asyncio.gather(*units):
+            manifest.extend(rows)
+        return manifest
+
+
+def build_and_write_manifest(concurrency: int = CONCURRENCY, rate: float = RATE,
+                             burst: int = BURST, resume: bool = True, cache: bool = True):
+    if not resume:
+        Path(JOURNAL).unlink(missing_ok=True)
+    journal = CrawlJournal(JOURNAL)
+    if len(journal):
+        logging.info(f"↻ Resuming: {len(journal)} units already in {JOURNAL}")
+    http_cache = HttpCache(CACHE) if cache else None
+    crawler = Crawler(concurrency, rate, burst, journal, http_cache)
+    started = time.monotonic()
+    try:
+        manifest = asyncio.run(crawler.crawl())
+    finally:
+        journal.close()
+        if http_cache is not None:
+            http_cache.close()
 
     # write CSV
     keys = ["make", "model", "year", "bundle_url"]
@@ -92,8 +415,27 @@ def build_and_write_manifest():
         writer = csv.DictWriter(f, fieldnames=keys)
         writer.writeheader()
         writer.writerows(manifest)
-    logging.info(f"\n✅ Wrote {len(manifest)} entries to {OUTPUT_CSV}")
+    logging.info(f"\n✅ Wrote {len(manifest)} entries to {OUTPUT_CSV} "
+                 f"in {time.monotonic() - started:.0f}s ({crawler.stats})")
 
-if __name__ == "__main__":
-    build_and_write_manifest()
+    if crawler.stats.failed_units:
+        logging.warning(f"✖ {crawler.stats.failed_units} units failed; "
+                        f"run again to retry just those (kept {JOURNAL})")
+    else:
+        journal.discard()
 
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Crawl charm.li into the manual manifest CSV.")
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY,
+                        help="requests in flight at once")
+    parser.add_argument("--rate", type=float, default=RATE,
+                        help="requests per second per host")
+    parser.add_argument("--burst", type=int, default=BURST,
+                        help="requests a host may receive back to back")
+    parser.add_argument("--restart", action="store_true",
+                        help=f"ignore {JOURNAL} and crawl everything again")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"neither revalidate against nor update {CACHE}")
+    args = parser.parse_args()
+    build_and_write_manifest(args.concurrency, args.rate, args.burst,
+                             resume=not args.restart, cache=not args.no_cache)
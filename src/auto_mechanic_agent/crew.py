@@ -1,12 +1,15 @@
 from crewai import Agent, Crew, Process, Task
-from crewai.project import CrewBase, agent, crew, task
+from crewai.project import CrewBase, agent, before_kickoff, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
-from typing import List
+from typing import Dict, List, Optional
 from dotenv import load_dotenv
 import logging
-from auto_mechanic_agent.tools.custom_tool import PDFCreatorTool
-from auto_mechanic_agent.tools.custom_tool import ImageGenTool
-from auto_mechanic_agent.tools.custom_tool import QueryManifestTool
+from auto_mechanic_agent.tools.pdf_creator import PDFCreatorTool
+from auto_mechanic_agent.tools.image_gen import ImageGenTool
+from auto_mechanic_agent.tools.query_manifest import QueryManifestTool
+from auto_mechanic_agent.tools.catalog import vehicle_catalog
+from auto_mechanic_agent.tools.gazetteer import vehicle_gazetteer
+from auto_mechanic_agent.tools.vin import find_vin, manifest_vehicle
 
 load_dotenv()
 
@@ -24,6 +27,44 @@ class AutoMechanicAgent():
         super().__init__()
         load_dotenv()
         logging.basicConfig(level=logging.INFO)
+        # the vehicle found in the problem text before kickoff, if any
+        self._vehicle: Optional[Dict] = None
+
+    @before_kickoff
+    def identify_vehicle(self, inputs):
+        """
+        Resolve the vehicle offline, from a VIN or else from the make, model
+        and year named in the problem text, instead of asking the LLM. This
+        also loads the in-memory vehicle catalog before the first lookup
+        needs it.
+        """
+        problem = inputs.get("problem", "")
+        try:
+            vehicle_catalog()
+            offline = True
+        except FileNotFoundError as e:
+            # leave it to the agents; the first query_manifest call reports it
+            logging.warning(f"Vehicle catalog unavailable: {e}")
+            offline = False
+
+        vin = find_vin(problem) if offline else None
+        self._vehicle = manifest_vehicle(vin) if vin else None
+        if self._vehicle:
+            name = " ".join(str(v) for v in (self._vehicle["year"], self._vehicle["make"],
+                                              self._vehicle["model"]) if v)
+            inputs["problem"] += (f"\n(VIN {vin} decodes to a {name}; "
+                                  f"pass vin=\"{vin}\" to query_manifest.)")
+        elif offline:
+            self._vehicle = vehicle_gazetteer().best(problem)
+
+        if self._vehicle:
+            inputs["vehicle"] = (f'make="{self._vehicle["make"]}", '
+                                 f'model="{self._vehicle["model"] or ""}", '
+                                 f'year="{self._vehicle["year"] or ""}"')
+        else:
+            # no extra LLM step: the solution task reads it from the user's words
+            inputs["vehicle"] = f'not identified yet; take it from the user\'s own words "{problem}"'
+        return inputs
 
     @agent
     def text_parser(self) -> Agent:
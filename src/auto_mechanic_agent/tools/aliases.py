@@ -0,0 +1,68 @@
+from typing import Dict, Iterator, Tuple
+
+from auto_mechanic_agent.tools.manifest_db import manifest_pool, per_generation, search_key
+
+ALIASES_SQL = {
+    "makes":  "SELECT alias, make FROM make_aliases",
+    "models": "SELECT make::TEXT, alias, canonical FROM model_aliases",
+}
+
+
+class VehicleAliases:
+    """
+    The `make_aliases` and `model_aliases` tables built with the database,
+    applied in memory: "Dodge" -> "Dodge and Ram", Ford "f150" -> "f 150".
+    """
+
+    def __init__(self, make_rows, model_rows):
+        self._makes: Dict[str, str] = dict(make_rows)
+        self._models: Dict[str, Dict[Tuple[str, ...], str]] = {}
+        for make, alias, canonical in model_rows:
+            self._models.setdefault(make, {})[tuple(alias.split())] = canonical
+
+    def make_items(self) -> Iterator[Tuple[str, str]]:
+        """(alias, make) for every make alias."""
+        return iter(self._makes.items())
+
+    def model_items(self) -> Iterator[Tuple[str, str, str]]:
+        """(make, alias, canonical) for every model alias."""
+        for make, synonyms in self._models.items():
+            for alias, canonical in synonyms.items():
+                yield make, " ".join(alias), canonical
+
+    def make(self, make: str) -> str:
+        """The manifest's name for `make`, or `make` unchanged if it has no alias."""
+        return self._makes.get(search_key(make), make.strip())
+
+    def model_key(self, make: str, model: str) -> str:
+        """search_key(model) with `make`'s synonyms (one or two words) replaced."""
+        words = search_key(model).split()
+        synonyms = self._models.get(make)
+        if not synonyms:
+            return " ".join(words)
+
+        out = []
+        i = 0
+        while i < len(words):
+            pair = tuple(words[i:i + 2])
+            if len(pair) == 2 and pair in synonyms:
+                out.append(synonyms[pair])
+                i += 2
+            else:
+                out.append(synonyms.get(pair[:1], words[i]))
+                i += 1
+        return " ".join(out)
+
+    def canonical(self, make: str, model: str) -> Tuple[str, str]:
+        """(manifest make, canonical model search key) for a requested vehicle."""
+        make = self.make(make)
+        return make, self.model_key(make, model)
+
+
+@per_generation
+def vehicle_aliases() -> VehicleAliases:
+    """The process-wide alias tables, reloaded when the database file changes."""
+    with manifest_pool().cursor() as cur:
+        makes = cur.execute(ALIASES_SQL["makes"]).fetchall()
+        models = cur.execute(ALIASES_SQL["models"]).fetchall()
+    return VehicleAliases(makes, models)
@@ -0,0 +1,88 @@
+import argparse
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+from auto_mechanic_agent.tools.catalog import VehicleCatalog, vehicle_catalog
+from auto_mechanic_agent.tools.manifest_db import per_generation, search_key
+
+_END = "\uffff"  # sorts after every normalized key
+
+
+def _prefixed(keys: List[str], names: List[str], prefix: str, limit: int) -> List[str]:
+    """Names whose sorted `keys` entry starts with `prefix`, via two bisections."""
+    lo = bisect_left(keys, prefix)
+    hi = bisect_left(keys, prefix + _END, lo)
+    return names[lo:min(hi, lo + limit)]
+
+
+class VehicleAutocomplete:
+    """
+    Sorted-prefix indexes over make names, each make's years and each
+    (make, year)'s base model names, built from the in-memory catalog.
+    A completion is two bisections over a sorted list.
+    """
+
+    def __init__(self, catalog: VehicleCatalog):
+        makes = sorted((search_key(m), m) for m in catalog.makes)
+        self._make_keys = [k for k, _ in makes]
+        self._make_names = [m for _, m in makes]
+        self._years: Dict[str, List[int]] = {}
+        self._models: Dict[Tuple[str, Optional[int]], Tuple[List[str], List[str]]] = {}
+
+        per_slice: Dict[Tuple[str, Optional[int]], Dict[str, str]] = {}
+        for make, year, lo, hi in catalog.slices():
+            self._years.setdefault(make, []).append(year)
+            for i in range(lo, hi):
+                key, name = catalog.base_keys[i], catalog.base_models[i]
+                per_slice.setdefault((make, year), {}).setdefault(key, name)
+                per_slice.setdefault((make, None), {}).setdefault(key, name)
+
+        for years in self._years.values():
+            years.sort()
+        for slot, names in per_slice.items():
+            ordered = sorted(names.items())
+            self._models[slot] = ([k for k, _ in ordered], [n for _, n in ordered])
+
+    def makes(self, prefix: str = "", limit: int = 20) -> List[str]:
+        return _prefixed(self._make_keys, self._make_names, search_key(prefix), limit)
+
+    def years(self, make: str, prefix: str = "") -> List[int]:
+        return [y for y in self._years.get(make.strip(), []) if str(y).startswith(prefix.strip())]
+
+    def models(self, make: str, year: Optional[int] = None, prefix: str = "",
+               limit: int = 20) -> List[str]:
+        """Base model names of `make` (in `year`, if given) starting with `prefix`."""
+        keys, names = self._models.get((make.strip(), int(year) if year else None), ([], []))
+        return _prefixed(keys, names, search_key(prefix), limit)
+
+
+@per_generation
+def vehicle_autocomplete() -> VehicleAutocomplete:
+    """The process-wide index, rebuilt whenever the catalog reloads."""
+    return VehicleAutocomplete(vehicle_catalog())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Complete vehicle makes, years and models.")
+    parser.add_argument("prefix", nargs="?", default="",
+                        help="text typed so far (a make, or a model when --make is given)")
+    parser.add_argument("--make", help="complete models (or --years) of this make")
+    parser.add_argument("--year", type=int, help="only models offered in this year")
+    parser.add_argument("--years", action="store_true", help="complete years of --make instead")
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    index = vehicle_autocomplete()
+    if args.make and args.years:
+        results = index.years(args.make, args.prefix)
+    elif args.make:
+        results = index.models(args.make, args.year, args.prefix, args.limit)
+    else:
+        results = index.makes(args.prefix, args.limit)
+
+    for result in results:
+        print(result)
+
+
+if __name__ == "__main__":
+    main()
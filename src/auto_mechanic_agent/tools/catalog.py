@@ -0,0 +1,186 @@
+import heapq
+import re
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+from auto_mechanic_agent.tools.manifest_db import manifest_pool, per_generation, search_key
+
+CATALOG_SQL = """
+    SELECT make::TEXT, year, base_key, model_key, base_model, model, bundle_url
+      FROM manifest
+     ORDER BY make, year, model_key
+"""
+
+
+def trigrams(key: str) -> FrozenSet[str]:
+    """Python twin of TRIGRAMS_SQL in vehicle_knowledge_source.py."""
+    padded = f"  {key} "
+    return frozenset(padded[i:i + 3] for i in range(len(key) + 1))
+
+
+def year_window(year, tolerance: int = 0) -> Tuple[int, int, Optional[int]]:
+    """
+    (first, last, center) years a lookup covers: `year` +/- `tolerance`, or
+    an explicit "2001-2004" range (no center). Raises ValueError otherwise.
+    """
+    text = str(year).strip()
+    span = re.fullmatch(r"(\d{4})\s*-\s*(\d{4})", text)
+    if span:
+        first, last = sorted(map(int, span.groups()))
+        return first, last, None
+    center = int(text)
+    return center - tolerance, center + tolerance, center
+
+
+class VehicleCatalog:
+    """
+    The whole manifest as compact in-process columns, for lookups that never
+    touch DuckDB.
+
+    Rows are sorted by (make, year, model_key). Make names are interned and
+    stored once, per-row makes and years live in typed arrays, and
+    (make, year) maps to the [start, end) slice of that make/year's models.
+    Repeated strings (base model names, scraped model text) are interned.
+    """
+
+    def __init__(self, rows):
+        self.makes: List[str] = []
+        self._make_ids: Dict[str, int] = {}
+        self.make_ids = array("H")
+        self.years = array("H")
+        self.base_keys: List[str] = []
+        self.model_keys: List[str] = []
+        self.base_models: List[str] = []
+        self.models: List[str] = []
+        self.bundle_urls: List[str] = []
+        self._slices: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        self._make_slices: Dict[int, Tuple[int, int]] = {}
+        self._grams: Dict[str, FrozenSet[str]] = {}
+
+        for i, (make, year, base_key, model_key, base_model, model, url) in enumerate(rows):
+            make_id = self._make_ids.get(make)
+            if make_id is None:
+                make_id = self._make_ids[make] = len(self.makes)
+                self.makes.append(sys.intern(make))
+            self.make_ids.append(make_id)
+            self.years.append(year)
+            self.base_keys.append(sys.intern(base_key))
+            self.model_keys.append(model_key)
+            self.base_models.append(sys.intern(base_model))
+            self.models.append(sys.intern(model))
+            self.bundle_urls.append(url)
+
+            lo, _ = self._slices.get((make_id, year), (i, i))
+            self._slices[(make_id, year)] = (lo, i + 1)
+            lo, _ = self._make_slices.get(make_id, (i, i))
+            self._make_slices[make_id] = (lo, i + 1)
+            if base_key not in self._grams:
+                self._grams[base_key] = trigrams(base_key)
+
+    def __len__(self):
+        return len(self.bundle_urls)
+
+    def has(self, make: str, year: Optional[int] = None) -> bool:
+        """Whether the manifest has bundles for `make` (in `year`, if given)."""
+        make_id = self._make_ids.get(make)
+        if make_id is None:
+            return False
+        return year is None or (make_id, int(year)) in self._slices
+
+    def bundles(self, make: str, year: int) -> List[Dict]:
+        """Every bundle of `make` in `year`, unranked (score None)."""
+        make_id = self._make_ids.get(make)
+        lo, hi = self._slices.get((make_id, int(year)), (0, 0))
+        return [self._row(i, None) for i in range(lo, hi)]
+
+    def slices(self) -> Iterator[Tuple[str, int, int, int]]:
+        """(make, year, start, end) for every make/year slice of the rows."""
+        for (make_id, year), (lo, hi) in self._slices.items():
+            yield self.makes[make_id], year, lo, hi
+
+    def _row(self, i: int, score: Optional[float]) -> Dict:
+        if score is not None:
+            # round half up, like DuckDB's round()
+            score = float(Decimal(score).quantize(Decimal("0.001"), ROUND_HALF_UP))
+        return {"bundle_url": self.bundle_urls[i], "base_model": self.base_models[i],
+                "model": self.models[i], "year": self.years[i], "score": score}
+
+    def rank(self, make: str, model: str, year: Optional[str] = None, k: int = 5,
+             tolerance: int = 0) -> List[Dict]:
+        """
+        Same results as model_match.rank_models, answered from memory. With a
+        `tolerance` (or a "2001-2004" range as `year`), neighbouring years
+        qualify too, nearest year first and best score within a year.
+        """
+        key = search_key(model)
+        make_id = self._make_ids.get(make.strip())
+        if not key or make_id is None:
+            return []
+
+        lo, hi = self._make_slices[make_id]
+        center = None
+        if year:
+            try:
+                first, last, center = year_window(year, tolerance)
+            except ValueError:
+                return []
+            # rows are sorted by year within the make
+            lo, hi = bisect_left(self.years, first, lo, hi), bisect_right(self.years, last, lo, hi)
+
+        q = trigrams(key)
+        scores: Dict[str, float] = {}
+        ranked = []
+        for i in range(lo, hi):
+            base_key = self.base_keys[i]
+            score = scores.get(base_key)
+            if score is None:
+                grams = self._grams[base_key]
+                score = scores[base_key] = 2.0 * len(q & grams) / (len(q) + len(grams))
+            if score > 0:
+                year_i = self.years[i]
+                distance = abs(year_i - center) if center is not None else 0
+                ranked.append((distance, -score, -year_i, self.model_keys[i], i))
+
+        return [self._row(entry[-1], -entry[1]) for entry in heapq.nsmallest(k, ranked)]
+
+    def memory_bytes(self) -> int:
+        """Approximate deep size of the catalog, counting shared strings once."""
+        seen = set()
+        total = 0
+
+        def add(obj):
+            nonlocal total
+            if id(obj) not in seen:
+                seen.add(id(obj))
+                total += sys.getsizeof(obj)
+
+        for container in (self.makes, self.make_ids, self.years, self.base_keys,
+                          self.model_keys, self.base_models, self.models,
+                          self.bundle_urls, self._make_ids, self._slices,
+                          self._make_slices, self._grams):
+            add(container)
+        for column in (self.makes, self.base_keys, self.model_keys,
+                       self.base_models, self.models, self.bundle_urls):
+            for s in column:
+                add(s)
+        for key, span in self._slices.items():
+            add(key)
+            add(span)
+        for grams in self._grams.values():
+            add(grams)
+            for g in grams:
+                add(g)
+        return total
+
+
+@per_generation
+def vehicle_catalog() -> VehicleCatalog:
+    """
+    The process-wide catalog, loaded from the manifest on first use and
+    reloaded when vehicle_knowledge_source.py swaps in a new database.
+    """
+    with manifest_pool().cursor() as cur:
+        return VehicleCatalog(cur.execute(CATALOG_SQL).fetchall())
@@ -0,0 +1,109 @@
+from typing import Dict, Iterable, List, Mapping, Sequence, Union
+
+from auto_mechanic_agent.tools.manifest_db import manifest_pool
+from auto_mechanic_agent.tools.model_match import QUERY_GRAMS_SQL
+from auto_mechanic_agent.tools.spelling import vehicle_speller
+
+Vehicle = Union[Mapping[str, str], Sequence[str]]
+
+# One set-based pass: the requests arrive as a single delimited string (record
+# separator between vehicles, unit separator between fields; binding one
+# VARCHAR is far cheaper than binding Python lists element by element), are
+# unnested into a relation and scored against the make's trigram index the
+# same way model_match.RANK_SQL scores one request. Each request keeps its
+# best bundle in its year (or a NULL row when nothing matched).
+#
+# confidence = Dice coefficient between the request's trigrams and the
+# bundle's base model name, the `score` rank_models reports.
+BATCH_SQL = f"""
+WITH raw AS (
+    SELECT unnest(recs) AS rec, generate_subscripts(recs, 1) AS idx
+      FROM (SELECT string_split(?, chr(30)) AS recs)
+),
+req AS (
+    -- cast up front so the joins below plan as hash joins on (make, year)
+    SELECT idx,
+           TRY_CAST(split_part(rec, chr(31), 1) AS make_name) AS make,
+           split_part(rec, chr(31), 2) AS model_key,
+           TRY_CAST(split_part(rec, chr(31), 3) AS INTEGER) AS year
+      FROM raw
+),
+grams AS (
+    SELECT idx, make, year, unnest(g) AS trigram, len(g) AS q_grams
+      FROM (SELECT idx, make, year, {QUERY_GRAMS_SQL.format(key="model_key")} AS g
+              FROM req
+             WHERE model_key <> '')
+),
+-- only names the make actually has in the requested year
+names AS (
+    SELECT DISTINCT m.make, m.year, m.base_key
+      FROM manifest m
+      JOIN (SELECT DISTINCT make, year FROM req) r USING (make, year)
+),
+scores AS (
+    SELECT g.idx, n.base_key,
+           2.0 * count(*) / (any_value(g.q_grams) + any_value(t.grams)) AS score
+      FROM grams g
+      JOIN model_trigrams t ON t.make = g.make AND t.trigram = g.trigram
+      JOIN names n ON n.make = g.make AND n.year = g.year AND n.base_key = t.base_key
+     GROUP BY g.idx, n.base_key
+),
+best AS (
+    SELECT s.idx,
+           arg_min(m.bundle_url, (-s.score, m.model_key)) AS bundle_url,
+           max(s.score) AS confidence
+      FROM scores s
+      JOIN req r USING (idx)
+      JOIN manifest m ON m.make = r.make AND m.year = r.year AND m.base_key = s.base_key
+     GROUP BY s.idx
+)
+SELECT r.idx, b.bundle_url, round(coalesce(b.confidence, 0), 3) AS confidence
+  FROM req r
+  LEFT JOIN best b USING (idx)
+ ORDER BY r.idx
+"""
+
+
+_RS, _US = "\x1e", "\x1f"
+
+
+def _fields(vehicle: Vehicle):
+    if isinstance(vehicle, Mapping):
+        return vehicle["make"], vehicle["model"], vehicle["year"]
+    make, model, year = vehicle
+    return make, model, year
+
+
+def lookup_vehicles(vehicles: Iterable[Vehicle]) -> List[Dict]:
+    """
+    Resolve many (make, model, year) vehicles to manual bundles in one query.
+
+    Each vehicle is a mapping with make/model/year keys or a 3-tuple; makes
+    and models are spell-corrected and canonicalized through the alias
+    tables first. Returns
+    one dict per input, in input order, with the input fields plus
+    `bundle_url` (None when nothing matched) and a `confidence` in [0, 1].
+    """
+    requests = [tuple(str(v).strip() for v in _fields(vehicle)) for vehicle in vehicles]
+    if not requests:
+        return []
+
+    # fleets repeat the same vehicles; correct each distinct one once
+    speller = vehicle_speller()
+    canonical = {}
+    for make, model, _ in requests:
+        if (make, model) not in canonical:
+            canonical[make, model] = speller.canonical(make, model)
+    packed = _RS.join(
+        _US.join(f.replace(_RS, " ").replace(_US, " ")
+                 for f in (*canonical[make, model], year))
+        for make, model, year in requests
+    )
+    with manifest_pool().cursor() as cur:
+        rows = cur.execute(BATCH_SQL, [packed]).fetchall()
+
+    return [
+        {"make": make, "model": model, "year": year,
+         "bundle_url": bundle_url, "confidence": float(confidence)}
+        for (make, model, year), (_, bundle_url, confidence) in zip(requests, rows)
+    ]
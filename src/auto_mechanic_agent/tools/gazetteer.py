@@ -0,0 +1,223 @@
+import re
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from auto_mechanic_agent.tools.aliases import VehicleAliases, vehicle_aliases
+from auto_mechanic_agent.tools.catalog import VehicleCatalog, vehicle_catalog
+from auto_mechanic_agent.tools.manifest_db import per_generation, search_key
+
+# Extractions at or above this confidence need no LLM to confirm them
+HIGH_CONFIDENCE = 0.9
+# Ceiling for a vehicle that more than one mentioned year fits
+_AMBIGUOUS = 0.8
+
+_YEAR_RE = re.compile(r"\b(19[89]\d|20[0-3]\d)\b|'(\d{2})\b")
+
+# A number followed by one of these is a reading, not a model year
+# ("2000 rpm", "2010 miles")
+_UNITS = frozenset({
+    "rpm", "rpms", "mile", "miles", "mi", "km", "kms", "kilometers", "cc",
+    "lb", "lbs", "pounds", "psi", "ft", "hp", "volts", "watts", "k",
+})
+
+# Model words that say nothing about the make on their own: body styles, and
+# model names that are also everyday or workshop words ("spark", "relay").
+# A phrase made only of these (or of one- and two-letter words), or one that
+# starts with a number ("5", "6 cylinder", "4 wheel"), counts once the make
+# is named, never by itself.
+_GENERIC = frozenset({
+    "pickup", "truck", "van", "sedan", "coupe", "wagon", "hatchback",
+    "convertible", "classic", "new", "cab", "chassis", "hardtop", "2wd", "4wd",
+    "arrow", "champ", "city", "crown", "del", "edge", "eagle", "echo", "excel",
+    "fifth", "fit", "five", "flex", "focus", "full", "grand", "gran", "leaf",
+    "mark", "mini", "park", "pilot", "probe", "quest", "range", "reach", "relay",
+    "sky", "spark", "storm", "town", "trans", "turbo", "wave",
+})
+
+
+def _vague(phrase: str) -> bool:
+    words = phrase.split()
+    return (not words or words[0][0].isdigit()
+            or all(w in _GENERIC or (len(w) <= 2 and w.isalpha()) for w in words))
+
+
+Phrase = Tuple[str, ...]
+
+
+class WordAutomaton:
+    """
+    Aho-Corasick automaton over words: every pattern (a tuple of words) is
+    found in one left-to-right pass over the text, however many there are.
+    """
+
+    def __init__(self, patterns: Dict[Phrase, list]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, list]]] = [[]]
+
+        for words, payload in patterns.items():
+            state = 0
+            for word in words:
+                nxt = self._goto[state].get(word)
+                if nxt is None:
+                    nxt = self._goto[state][word] = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = nxt
+            self._out[state].append((len(words), payload))
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for word, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and word not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(word, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def __len__(self):
+        return len(self._goto)
+
+    def finditer(self, words: List[str]) -> Iterator[Tuple[int, int, list]]:
+        """(start, end, payload) for every pattern occurrence in `words`."""
+        state = 0
+        for end, word in enumerate(words, 1):
+            while state and word not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(word, 0)
+            for length, payload in self._out[state]:
+                yield end - length, end, payload
+
+
+def _years(text: str) -> List[Tuple[int, int]]:
+    """(word position in search_key(text), year) for every model year mentioned."""
+    years = []
+    for match in _YEAR_RE.finditer(text):
+        following = search_key(text[match.end():match.end() + 16]).split()
+        if following and following[0] in _UNITS:
+            continue
+        four, two = match.groups()
+        if four:
+            year = int(four)
+        else:
+            year = 1900 + int(two) if int(two) >= 80 else 2000 + int(two)
+        years.append((len(search_key(text[:match.start()]).split()), year))
+    return years
+
+
+class VehicleGazetteer:
+    """
+    Pulls (make, model, year) out of free text without an LLM.
+
+    Patterns are every make alias plus every word prefix of each make's base
+    model names ("civic", "civic dx", "civic dx coupe") and model aliases,
+    matched in a single pass; years come from a regex.
+    """
+
+    def __init__(self, catalog: VehicleCatalog, aliases: VehicleAliases):
+        self._catalog = catalog
+        patterns: Dict[Phrase, list] = {}
+        for alias, make in aliases.make_items():
+            patterns.setdefault(tuple(alias.split()), []).append(("make", make, None))
+
+        for make, _, lo, hi in catalog.slices():
+            for base_key in set(catalog.base_keys[lo:hi]):
+                words = base_key.split()
+                for n in range(1, len(words) + 1):
+                    entry = ("model", make, " ".join(words[:n]))
+                    bucket = patterns.setdefault(tuple(words[:n]), [])
+                    if entry not in bucket:
+                        bucket.append(entry)
+
+        for make, alias, canonical in aliases.model_items():
+            patterns.setdefault(tuple(alias.split()), []).append(("model", make, canonical))
+
+        self._automaton = WordAutomaton(patterns)
+
+    def extract(self, text: str) -> List[Dict]:
+        """
+        Candidate vehicles in `text`, best first, each with make, model (a
+        search key, or None), year (or None) and a confidence in [0, 1].
+        """
+        words = search_key(text).split()
+        named: Dict[str, int] = {}  # make -> first position it is named at
+        models: Dict[str, List[Tuple[int, int, str]]] = {}
+        for start, end, payload in self._automaton.finditer(words):
+            for kind, make, value in payload:
+                if kind == "make":
+                    named.setdefault(make, start)
+                else:
+                    models.setdefault(make, []).append((start, end, value))
+
+        # a model names its make on its own only if few makes share it
+        sharing: Dict[str, int] = {}
+        for make, hits in models.items():
+            for _, _, value in hits:
+                sharing[value] = sharing.get(value, 0) + 1
+
+        years = _years(text)
+        year_words = {position for position, _ in years}
+        candidates = []
+        for make in set(named) | set(models):
+            # a year is never also a model name ("2002 Honda" is not model "2002")
+            hits = [h for h in models.get(make, ())
+                    if (make in named or not _vague(h[2]))
+                    and not year_words.intersection(range(h[0], h[1]))]
+            if make not in named and not hits:
+                continue
+            # longest model phrase, then the one nearest the make's mention
+            anchor = named.get(make)
+            best_hit = min(hits, key=lambda h: (h[0] - h[1], abs(h[0] - (anchor or 0))),
+                           default=None)
+            model = best_hit[2] if best_hit else None
+
+            if make in named:
+                make_conf = 1.0
+            else:
+                make_conf = 0.8 / sharing[model]
+
+            # the year right before this vehicle ("my 2002 Honda Civic"), else
+            # the nearest one, preferring years the model was actually sold in
+            mention = min(p for p in (anchor, best_hit and best_hit[0]) if p is not None)
+            plausible = [y for _, y in years
+                         if (self._catalog.rank(make, model, y, k=1) if model
+                             else self._catalog.has(make, y))]
+            year, year_conf = None, 0.0
+            for position, y in sorted(years, key=lambda py: (py[0] != mention - 1,
+                                                             abs(py[0] - mention))):
+                if y in plausible:
+                    year, year_conf = y, 1.0 if model else 0.5
+                    break
+                if year is None:
+                    year, year_conf = y, 0.5 if self._catalog.has(make, y) else 0.25
+
+            confidence = 0.4 * make_conf + 0.35 * (model is not None) + 0.25 * year_conf
+            if len(set(plausible)) > 1:
+                # "my 2005 Accord, bought it in 2010": leave the pick to the LLM
+                confidence = min(confidence, _AMBIGUOUS)
+            candidates.append({"make": make, "model": model, "year": year,
+                               "confidence": round(confidence, 3)})
+
+        candidates.sort(key=lambda c: (-c["confidence"], c["make"]))
+        return candidates
+
+    def best(self, text: str, threshold: float = HIGH_CONFIDENCE) -> Optional[Dict]:
+        """
+        The top candidate if its confidence reaches `threshold` and no other
+        vehicle ties it, else None.
+        """
+        found = self.extract(text)
+        if not found or found[0]["confidence"] < threshold:
+            return None
+        if len(found) > 1 and found[1]["confidence"] == found[0]["confidence"]:
+            return None
+        return found[0]
+
+
+@per_generation
+def vehicle_gazetteer() -> VehicleGazetteer:
+    """The process-wide extractor, rebuilt when the catalog or aliases reload."""
+    return VehicleGazetteer(vehicle_catalog(), vehicle_aliases())
@@ -0,0 +1,47 @@
+import os
+import threading
+import uuid
+from typing import Optional, Type
+
+from crewai.tools import BaseTool
+from pydantic import BaseModel, Field
+
+from auto_mechanic_agent.tools.paths import tests_dir
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def openai_client():
+    """The shared OpenAI client, built on the first image request."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                from openai import OpenAI
+                _client = OpenAI()
+    return _client
+
+
+class ImageGenInput(BaseModel):
+    prompt: str = Field(..., description="A text prompt to generate your image")
+    size: Optional[str] = Field("512x512", description="Image size, e.g. 256x256 or 512x512")
+
+class ImageGenTool(BaseTool):
+    name: str = "generate_image"
+    description: str = "Generate an image from a text prompt via OpenAI and return the local file path."
+    args_schema: Type[BaseModel] = ImageGenInput
+
+    def _run(self, prompt: str, size: str = "512x512") -> str:
+        import requests
+
+        resp = openai_client().images.generate(prompt=prompt, size=size, n=1)
+        url = resp.data[0].url
+        img_bytes = requests.get(url).content
+
+        filename = f"generated_image_{uuid.uuid4().hex}.png"
+        out_path = os.path.join(tests_dir(), filename)
+        with open(out_path, "wb") as f:
+            f.write(img_bytes)
+
+        return out_path
@@ -0,0 +1,81 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+# Bounds for the process-wide manifest lookup cache
+CACHE_SIZE = int(os.getenv("MANIFEST_CACHE_SIZE", 4096))
+CACHE_TTL  = float(os.getenv("MANIFEST_CACHE_TTL", 0)) or None  # seconds; unset = no expiry
+
+MISS = object()
+
+
+class LookupCache:
+    """
+    Thread-safe LRU cache with an optional TTL and hit/miss counters.
+
+    Entries belong to a database generation (see ManifestPool.generation);
+    the first lookup against a different generation drops every entry, so a
+    rebuilt or rolled-back manifest is never answered from stale results.
+    """
+
+    def __init__(self, maxsize: int = CACHE_SIZE, ttl: Optional[float] = CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._generation = None
+        self._lock = threading.Lock()
+
+    def _sync(self, generation):
+        if generation != self._generation:
+            self._data.clear()
+            self._generation = generation
+
+    def get(self, key: Hashable, generation=None) -> Any:
+        """The cached value for `key`, or MISS."""
+        with self._lock:
+            self._sync(generation)
+            entry = self._data.get(key)
+            if entry is not None:
+                value, stored = entry
+                if self.ttl is None or time.monotonic() - stored < self.ttl:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return MISS
+
+    def put(self, key: Hashable, value: Any, generation=None):
+        with self._lock:
+            self._sync(generation)
+            self._data[key] = (value, time.monotonic())
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "size": len(self._data), "maxsize": self.maxsize}
+
+
+_cache: Optional[LookupCache] = None
+_cache_lock = threading.Lock()
+
+
+def lookup_cache() -> LookupCache:
+    """The process-wide cache in front of QueryManifestTool."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = LookupCache()
+    return _cache
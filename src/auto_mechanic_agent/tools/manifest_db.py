@@ -0,0 +1,171 @@
+import functools
+import os
+import re
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, TypeVar
+
+HERE      = Path(__file__).resolve()
+REPO_ROOT = HERE.parents[3]  # .../src/auto_mechanic_agent/tools → up to repo root
+DB_PATH   = REPO_ROOT / "knowledge" / "manuals.duckdb"
+
+# Concurrent lookups allowed per process; defaults to one per CPU
+POOL_SIZE = int(os.getenv("MANIFEST_POOL_SIZE", os.cpu_count() or 4))
+
+
+def search_key(text: str) -> str:
+    """Normalize a model name the way the manifest's `model_key` column is built."""
+    return re.sub(r"[^a-z0-9]+", " ", text.lower()).strip()
+
+
+class _Generation:
+    """One opened copy of the database file plus the cursors handed out from it."""
+
+    def __init__(self, stamp, conn):
+        self.stamp = stamp
+        self.conn = conn
+        self.idle = []
+        self.borrowed = 0
+
+
+class ManifestPool:
+    """
+    Thread-safe pool of read-only cursors over the manuals DuckDB.
+
+    The file is attached READ_ONLY to a private in-memory instance, so no
+    lookup ever takes the writer lock. vehicle_knowledge_source.py swaps in
+    a new file on rebuild; the pool notices the new inode on checkout and
+    moves to it, closing the old generation once its last cursor returns.
+    """
+
+    def __init__(self, db_path: Path = DB_PATH, size: int = POOL_SIZE):
+        self.db_path = Path(db_path)
+        self.size = size
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._current: Optional[_Generation] = None
+
+    def generation(self):
+        """Identity of the database file on disk; changes on every rebuild."""
+        try:
+            st = os.stat(self.db_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Couldn’t find DuckDB at {str(self.db_path)!r}") from None
+        return st.st_ino, st.st_mtime_ns
+
+    def _open(self, stamp) -> _Generation:
+        import duckdb  # deferred so importing the tools stays cheap
+
+        # a fresh in-memory instance bypasses DuckDB's per-path instance
+        # cache, which would otherwise keep serving the replaced file
+        conn = duckdb.connect()
+        path = str(self.db_path).replace("'", "''")
+        conn.execute(f"ATTACH '{path}' AS manuals (READ_ONLY)")
+        conn.execute("USE manuals")
+        return _Generation(stamp, conn)
+
+    def _checkout(self):
+        with self._lock:
+            stamp = self.generation()
+            if self._current is None or self._current.stamp != stamp:
+                old, self._current = self._current, self._open(stamp)
+                if old is not None:
+                    for cur in old.idle:
+                        cur.close()
+                    old.idle.clear()
+                    if old.borrowed == 0:
+                        old.conn.close()
+
+            gen = self._current
+            if gen.idle:
+                cur = gen.idle.pop()
+            else:
+                cur = gen.conn.cursor()
+                cur.execute("USE manuals")
+            gen.borrowed += 1
+            return gen, cur
+
+    def _checkin(self, gen: _Generation, cur):
+        with self._lock:
+            gen.borrowed -= 1
+            if gen is self._current:
+                gen.idle.append(cur)
+            else:
+                cur.close()
+                if gen.borrowed == 0:
+                    gen.conn.close()
+
+    @contextmanager
+    def cursor(self):
+        """Borrow a cursor; blocks while `size` cursors are already in use."""
+        with self._slots:
+            gen, cur = self._checkout()
+            try:
+                yield cur
+            finally:
+                self._checkin(gen, cur)
+
+    def close(self):
+        with self._lock:
+            if self._current is not None:
+                for cur in self._current.idle:
+                    cur.close()
+                if self._current.borrowed == 0:
+                    self._current.conn.close()
+                self._current = None
+
+
+def fetch_dicts(cur) -> List[Dict]:
+    """Rows of the last query on `cur` as dicts, straight from the cursor."""
+    cols = [d[0] for d in cur.description]
+    return [dict(zip(cols, row)) for row in cur.fetchall()]
+
+
+def iter_record_batches(sql: str, params=None, rows_per_batch: int = 100_000) -> Iterator:
+    """
+    Stream a query's result as pyarrow RecordBatches for bulk callers.
+    The pooled cursor is held until the iterator is exhausted or closed.
+    """
+    with manifest_pool().cursor() as cur:
+        reader = cur.execute(sql, params or []).fetch_record_batch(rows_per_batch)
+        yield from reader
+
+
+_pool: Optional[ManifestPool] = None
+_pool_lock = threading.Lock()
+
+
+def manifest_pool() -> ManifestPool:
+    """The process-wide pool shared by every QueryManifestTool."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ManifestPool()
+    return _pool
+
+
+T = TypeVar("T")
+
+
+def per_generation(load: Callable[[], T]) -> Callable[[], T]:
+    """
+    Turn `load` into a process-wide accessor: its result is built on first
+    use, shared by every thread, and built again once the pool sees a new
+    database file. Accessors that call other accessors rebuild with them.
+    """
+    lock = threading.Lock()
+    current = (None, None)  # (generation, value), swapped as one object
+
+    @functools.wraps(load)
+    def accessor() -> T:
+        nonlocal current
+        generation = manifest_pool().generation()
+        if current[0] != generation:
+            with lock:
+                if current[0] != generation:
+                    current = (generation, load())
+        return current[1]
+
+    return accessor
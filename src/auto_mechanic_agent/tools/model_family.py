@@ -0,0 +1,77 @@
+from typing import Dict, List, Optional
+
+from auto_mechanic_agent.tools.aliases import vehicle_aliases
+from auto_mechanic_agent.tools.manifest_db import fetch_dicts, manifest_pool
+
+# Contiguous year runs of every model of the make whose normalized name
+# contains each word of the requested one ("civic 1488cc" -> 1982-1983, ...)
+RANGES_SQL = """
+SELECT name AS model, first_year, last_year, years
+  FROM model_family
+ WHERE make = TRY_CAST($make AS make_name)
+   AND list_bool_and(list_transform(string_split($key, ' '), w -> contains(model_key, w)))
+ ORDER BY model_key, first_year
+"""
+
+# Models of a make on sale at some point in [$first, $last]
+OVERLAP_SQL = """
+SELECT name AS model, first_year, last_year, years
+  FROM model_family
+ WHERE make = TRY_CAST($make AS make_name)
+   AND first_year <= $last AND last_year >= $first
+ ORDER BY model_key, first_year
+"""
+
+# Per make: the span of years the manifest covers, how many model runs it
+# has, and the years inside that span without a single bundle
+COVERAGE_SQL = """
+WITH covered AS (
+    SELECT make, unnest(range(first_year, last_year + 1)) AS year, model_key
+      FROM model_family
+     WHERE $make IS NULL OR make = TRY_CAST($make AS make_name)
+),
+per_make AS (
+    SELECT make, min(year) AS first_year, max(year) AS last_year,
+           count(DISTINCT model_key)::INTEGER AS models,
+           list_distinct(list(year)) AS years
+      FROM covered
+     GROUP BY make
+)
+SELECT make::TEXT AS make, first_year, last_year, models,
+       len(years)::INTEGER AS years_covered,
+       list_sort(list_filter(range(first_year, last_year + 1),
+                             y -> NOT list_contains(years, y))) AS missing_years
+  FROM per_make
+ ORDER BY make
+"""
+
+
+def year_ranges(make: str, model: str) -> List[Dict]:
+    """
+    Which years have a manual for `model` (a full or partial name such as
+    "Civic L4-1668cc" or "civic"), as contiguous year ranges per model.
+    """
+    make, key = vehicle_aliases().canonical(make, model)
+    if not key:
+        return []
+    with manifest_pool().cursor() as cur:
+        cur.execute(RANGES_SQL, {"make": make, "key": key})
+        return fetch_dicts(cur)
+
+
+def models_between(make: str, first: int, last: int) -> List[Dict]:
+    """Every model run of `make` overlapping the years `first`..`last`."""
+    with manifest_pool().cursor() as cur:
+        cur.execute(OVERLAP_SQL, {"make": vehicle_aliases().make(make),
+                                  "first": int(first), "last": int(last)})
+        return fetch_dicts(cur)
+
+
+def coverage(make: Optional[str] = None) -> List[Dict]:
+    """
+    Coverage report per make (or just `make`): first and last year, number
+    of distinct models, years covered and the years missing in between.
+    """
+    with manifest_pool().cursor() as cur:
+        cur.execute(COVERAGE_SQL, {"make": vehicle_aliases().make(make) if make else None})
+        return fetch_dicts(cur)
@@ -0,0 +1,61 @@
+from typing import Dict, List, Optional
+
+from auto_mechanic_agent.tools.catalog import year_window
+from auto_mechanic_agent.tools.manifest_db import fetch_dicts, manifest_pool
+from auto_mechanic_agent.tools.spelling import vehicle_speller
+
+# Trigrams of a search key at query time, for every lookup in this package.
+# Must match TRIGRAMS_SQL in vehicle_knowledge_source.py
+QUERY_GRAMS_SQL = ("list_distinct([substr('  ' || {key} || ' ', i, 3) "
+                   "for i in range(1, length({key}) + 2)])")
+
+# Dice coefficient between the query's trigrams and each base model name of
+# the make, joined back to the manifest for the bundles of the best names.
+# Within a year window the year nearest $center comes first, then the
+# best-scoring names of that year.
+RANK_SQL = f"""
+WITH q AS (
+    SELECT unnest(g) AS trigram, len(g) AS q_grams
+      FROM (SELECT {QUERY_GRAMS_SQL.format(key="$key")} AS g)
+),
+scores AS (
+    SELECT t.base_key,
+           2.0 * count(*) / (any_value(q.q_grams) + any_value(t.grams)) AS score
+      FROM model_trigrams t
+      JOIN q USING (trigram)
+     WHERE t.make = TRY_CAST($make AS make_name)
+     GROUP BY t.base_key
+)
+SELECT m.bundle_url, m.base_model, m.model, m.year, round(s.score, 3) AS score
+  FROM scores s
+  JOIN manifest m
+    ON m.make = TRY_CAST($make AS make_name) AND m.base_key = s.base_key
+ WHERE $first IS NULL OR m.year BETWEEN $first AND $last
+ ORDER BY abs(m.year - coalesce($center, m.year)), s.score DESC, m.year DESC, m.model_key
+ LIMIT $k
+"""
+
+
+def rank_models(make: str, model: str, year: Optional[str] = None, k: int = 5,
+                tolerance: int = 0) -> List[Dict]:
+    """
+    Top-k manifest bundles for a possibly partial or misspelled model name,
+    scored by trigram similarity (1.0 = same name) against the make's models.
+    `year` may be widened by `tolerance` years or given as a "2001-2004" range.
+    """
+    make, key = vehicle_speller().canonical(make, model)
+    if not key:
+        return []
+    first = last = center = None
+    if year:
+        try:
+            first, last, center = year_window(year, tolerance)
+        except ValueError:
+            return []
+
+    with manifest_pool().cursor() as cur:
+        cur.execute(RANK_SQL, {
+            "make": make, "key": key,
+            "first": first, "last": last, "center": center, "k": k,
+        })
+        return fetch_dicts(cur)
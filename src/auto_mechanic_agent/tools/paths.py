@@ -0,0 +1,13 @@
+import os
+
+# Determine the tests directory relative to this file
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..', '..', '..')
+)
+TESTS_DIR = os.path.join(PROJECT_ROOT, 'tests')
+
+
+def tests_dir() -> str:
+    """TESTS_DIR, created on first use rather than at import."""
+    os.makedirs(TESTS_DIR, exist_ok=True)
+    return TESTS_DIR
@@ -0,0 +1,75 @@
+from typing import Dict, List, Optional, Type
+
+from crewai.tools import BaseTool
+from pydantic import BaseModel, Field
+
+from auto_mechanic_agent.tools.catalog import vehicle_catalog
+from auto_mechanic_agent.tools.lookup_cache import MISS, lookup_cache
+from auto_mechanic_agent.tools.manifest_db import manifest_pool, search_key
+from auto_mechanic_agent.tools.spelling import vehicle_speller
+from auto_mechanic_agent.tools.vin import manifest_vehicle
+
+
+class QueryArgs(BaseModel):
+    make: str = Field("", description="The vehicle make, e.g. Toyota")
+    model: str = Field("", description="The vehicle model or a substring thereof, e.g. Camry")
+    year: str = Field("", description="The model year, e.g. 2006, or a range, e.g. 2004-2007")
+    top_k: int = Field(5, description="How many ranked candidates to return")
+    year_tolerance: int = Field(0, description="Also accept bundles up to this many years "
+                                               "from `year`, nearest first")
+    vin: Optional[str] = Field(None, description="The 17-character VIN, if known; "
+                                                 "make and year are then decoded from it")
+
+class QueryManifestTool(BaseTool):
+    name: str = "query_manifest"
+    description: str = (
+        "Find the manual bundle_url for a given make/model/year in the DuckDB "
+        "`manifest` table. Returns up to top_k candidates ranked by how well "
+        "their model name matches (score 1.0 = exact), best first, each with "
+        "bundle_url, base_model, model, year and score. Misspelled makes and "
+        "models are corrected automatically; pick from these candidates "
+        "instead of retrying with different spellings. If the exact year may "
+        "have no manual, set year_tolerance (e.g. 3) rather than probing "
+        "neighbouring years one call at a time. If a VIN is known, "
+        "pass it as vin: make, year and usually the model line are decoded "
+        "from it offline."
+    )
+    args_schema: Type[QueryArgs] = QueryArgs
+
+    def _run(self, make: str = "", model: str = "", year: str = "", top_k: int = 5,
+             year_tolerance: int = 0, vin: Optional[str] = None) -> List[Dict]:
+        unranked = False
+        if vin:
+            vehicle = manifest_vehicle(vin)
+            if vehicle is None:
+                raise ValueError(f"VIN {vin!r} does not decode to a make/year in the manifest")
+            make, year = vehicle["make"], str(vehicle["year"])
+            model = model or vehicle["model"] or ""
+            # no model line in the VIN and none given: nothing to rank by
+            unranked = not search_key(model)
+
+        pool = manifest_pool()
+        generation = pool.generation()
+        # "Hundai" -> "Hyundai", "Dodge" -> "Dodge and Ram", "f150" -> "f 150",
+        # before the cache key
+        make, model = vehicle_speller().canonical(make, model)
+        year = year.strip()
+        key = (make, model, year, top_k, year_tolerance, unranked)
+        cached = lookup_cache().get(key, generation)
+        if cached is not MISS:
+            return [dict(row) for row in cached]
+
+        # answered from the in-memory catalog; DuckDB is only read on (re)load
+        if unranked:
+            # a make/year can have over a hundred bundles: hand back top_k
+            # of them and ask for the model rather than flood the context
+            bundles = vehicle_catalog().bundles(make, int(year))
+            rows = bundles[:top_k]
+            if len(bundles) > top_k:
+                rows.append({"note": f"{len(bundles)} bundles for {year} {make}; "
+                                     f"call again with the model to rank them"})
+        else:
+            rows = vehicle_catalog().rank(make, model, year, k=top_k, tolerance=year_tolerance)
+
+        lookup_cache().put(key, rows, generation)
+        return [dict(row) for row in rows]
@@ -0,0 +1,167 @@
+from typing import Collection, Dict, Iterable, Optional, Set, Tuple
+
+from auto_mechanic_agent.tools.aliases import VehicleAliases, vehicle_aliases
+from auto_mechanic_agent.tools.manifest_db import manifest_pool, per_generation, search_key
+
+VOCABULARY_SQL = {
+    # every make alias search key, including each make's own name
+    "makes": "SELECT alias, 1 FROM make_aliases",
+    # per make: each word of its base model names (with how many bundles use
+    # it) and each word of its model aliases, so nicknames are not "fixed"
+    "models": """
+        SELECT make, word, sum(n)::INTEGER
+          FROM (SELECT make::TEXT AS make, unnest(string_split(base_key, ' ')) AS word, 1 AS n
+                  FROM manifest
+                UNION ALL
+                SELECT make::TEXT, unnest(string_split(alias, ' ')), 1
+                  FROM model_aliases)
+         WHERE word <> ''
+         GROUP BY make, word
+    """,
+}
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Optimal-string-alignment distance between `a` and `b` (insertions,
+    deletions, substitutions and adjacent transpositions), or limit + 1 once
+    it is known to exceed `limit`.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    before, row = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(row[j] + 1, current[j - 1] + 1, row[j - 1] + cost)
+            if (before is not None and i > 1 and j > 1
+                    and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                current[j] = min(current[j], before[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        before, row = row, current
+    return row[-1]
+
+
+def _deletes(word: str, distance: int) -> Set[str]:
+    """`word` and every string made by deleting up to `distance` characters."""
+    found = {word}
+    frontier = {word}
+    for _ in range(distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier if len(w) > 1 for i in range(len(w))}
+        found |= frontier
+    return found
+
+
+class DeleteDictionary:
+    """
+    Symmetric-delete spelling correction (as in SymSpell): each word's
+    deletes are indexed up front, so correcting a term only generates the
+    term's own deletes and looks them up -- a fixed number of dict probes
+    however large the vocabulary is. Deletes are taken from the first
+    `prefix_length` characters only, which bounds the index size; candidates
+    are always verified against the whole word.
+    """
+
+    def __init__(self, counts: Dict[str, int], max_distance: int = 2, prefix_length: int = 7):
+        self.counts = counts
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        index: Dict[str, Set[str]] = {}
+        for word in counts:
+            for delete in _deletes(word[:prefix_length], max_distance):
+                index.setdefault(delete, set()).add(word)
+        self._index: Dict[str, Tuple[str, ...]] = {
+            delete: tuple(words) for delete, words in index.items()
+        }
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.counts
+
+    def lookup(self, term: str, max_distance: Optional[int] = None,
+               within: Optional[Collection[str]] = None) -> Optional[str]:
+        """
+        The closest vocabulary word to `term` (fewest edits, then most
+        frequent), restricted to `within` if given; None if none is within
+        `max_distance` edits.
+        """
+        limit = self.max_distance if max_distance is None else min(max_distance, self.max_distance)
+        best, best_rank = None, None
+        prefix = term[:self.prefix_length]
+        seen: Set[str] = set()
+        for delete in _deletes(prefix, limit):
+            for word in self._index.get(delete, ()):
+                if word in seen or (within is not None and word not in within):
+                    continue
+                seen.add(word)
+                distance = edit_distance(term, word, limit)
+                if distance > limit:
+                    continue
+                rank = (distance, -self.counts[word], word)
+                if best_rank is None or rank < best_rank:
+                    best, best_rank = word, rank
+        return best
+
+
+def _max_edits(word: str) -> int:
+    """Edits tolerated in a word of this length: none for short codes like "dx"."""
+    if len(word) <= 3 or not word.isalpha():
+        return 0
+    return 1 if len(word) <= 5 else 2
+
+
+class VehicleSpeller:
+    """
+    Corrects misspelled makes and model words against the manifest's own
+    vocabulary before alias canonicalization: "Hundai Sonta" -> Hyundai
+    "sonata", "Chevy Silverdo" -> Chevrolet "silverado". Model words are only
+    corrected towards words of the (corrected) make's own models.
+    """
+
+    def __init__(self, make_rows: Iterable[Tuple[str, int]],
+                 model_rows: Iterable[Tuple[str, str, int]], aliases: VehicleAliases):
+        self._aliases = aliases
+        self._makes = DeleteDictionary(dict(make_rows))
+        counts: Dict[str, int] = {}
+        self._make_words: Dict[str, Dict[str, int]] = {}
+        for make, word, n in model_rows:
+            self._make_words.setdefault(make, {})[word] = n
+            counts[word] = counts.get(word, 0) + n
+        self._words = DeleteDictionary(counts)
+
+    def make(self, make: str) -> str:
+        """`make` as a known make alias, corrected if it is close to one."""
+        key = search_key(make)
+        if not key or key in self._makes:
+            return make
+        return self._makes.lookup(key, max_distance=_max_edits(key.replace(" ", ""))) or make
+
+    def model(self, make: str, model: str) -> str:
+        """search_key(model) with words unknown to `make` replaced by its nearest word."""
+        known = self._make_words.get(make)
+        words = search_key(model).split()
+        if not known:
+            return " ".join(words)
+        return " ".join(
+            word if word in known
+            else self._words.lookup(word, max_distance=_max_edits(word), within=known) or word
+            for word in words
+        )
+
+    def canonical(self, make: str, model: str) -> Tuple[str, str]:
+        """Like VehicleAliases.canonical, after correcting spelling."""
+        make = self._aliases.make(self.make(make))
+        return make, self._aliases.model_key(make, self.model(make, model))
+
+
+@per_generation
+def vehicle_speller() -> VehicleSpeller:
+    """The process-wide spelling corrector, rebuilt when the database file changes."""
+    with manifest_pool().cursor() as cur:
+        makes = cur.execute(VOCABULARY_SQL["makes"]).fetchall()
+        models = cur.execute(VOCABULARY_SQL["models"]).fetchall()
+    return VehicleSpeller(makes, models, vehicle_aliases())
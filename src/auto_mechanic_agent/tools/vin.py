@@ -0,0 +1,248 @@
+import re
+from typing import Dict, List, Optional, Tuple
+
+# ISO 3779 check digit (position 9): letters transliterate to digits, each
+# position carries a weight, and the weighted sum mod 11 is the digit (10 = X)
+_TRANSLITERATION = {
+    **{str(d): d for d in range(10)},
+    "A": 1, "B": 2, "C": 3, "D": 4, "E": 5, "F": 6, "G": 7, "H": 8,
+    "J": 1, "K": 2, "L": 3, "M": 4, "N": 5, "P": 7, "R": 9,
+    "S": 2, "T": 3, "U": 4, "V": 5, "W": 6, "X": 7, "Y": 8, "Z": 9,
+}
+_WEIGHTS = (8, 7, 6, 5, 4, 3, 2, 10, 0, 9, 8, 7, 6, 5, 4, 3, 2)
+
+# Position 10; the cycle repeats every 30 years (A = 1980 and 2010)
+MODEL_YEAR_CODES = "ABCDEFGHJKLMNPRSTVWXY123456789"
+
+_VIN_RE = re.compile(r"\b[A-HJ-NPR-Z0-9]{17}\b")
+
+# World manufacturer identifiers (positions 1-3) mapped straight onto the
+# manifest's make names. Where one WMI covers several brands (Chrysler after
+# 2011), every candidate is listed and the catalog picks the one it has.
+WMI: Dict[str, Tuple[str, ...]] = {
+    # Acura / Honda
+    "JH4": ("Acura",), "19U": ("Acura",), "19V": ("Acura",), "2HN": ("Acura",),
+    "1HG": ("Honda",), "2HG": ("Honda",), "JHM": ("Honda",), "19X": ("Honda",),
+    "2HK": ("Honda",), "5FN": ("Honda",), "5J6": ("Honda",), "JHL": ("Honda",),
+    "SHH": ("Honda",),
+    # Audi / Volkswagen / Porsche
+    "WAU": ("Audi",), "WA1": ("Audi",), "TRU": ("Audi",), "WUA": ("Audi",),
+    "WVW": ("Volkswagen",), "WVG": ("Volkswagen",), "1VW": ("Volkswagen",),
+    "3VW": ("Volkswagen",), "9BW": ("Volkswagen",),
+    "WP0": ("Porsche",), "WP1": ("Porsche",),
+    # BMW / Mini
+    "WBA": ("BMW",), "WBS": ("BMW",), "WBX": ("BMW",), "WBY": ("BMW",),
+    "4US": ("BMW",), "5UX": ("BMW",), "5UM": ("BMW",),
+    "WMW": ("Mini",),
+    # General Motors
+    "1G1": ("Chevrolet",), "2G1": ("Chevrolet",), "3G1": ("Chevrolet",),
+    "1GC": ("Chevrolet",), "2GC": ("Chevrolet",), "3GC": ("Chevrolet",),
+    "1GN": ("Chevrolet",), "2GN": ("Chevrolet",), "3GN": ("Chevrolet",),
+    "1GB": ("Chevrolet",), "KL1": ("Chevrolet",),
+    "1G4": ("Buick",), "2G4": ("Buick",), "5GA": ("Buick",), "KL4": ("Buick",),
+    "1G6": ("Cadillac",), "1GY": ("Cadillac",),
+    "1GT": ("GMC",), "2GT": ("GMC",), "3GT": ("GMC",), "1GK": ("GMC",),
+    "2GK": ("GMC",), "3GK": ("GMC",), "1GD": ("GMC",),
+    "1G3": ("Oldsmobile",), "2G3": ("Oldsmobile",), "1GH": ("Oldsmobile",),
+    "1G2": ("Pontiac",), "2G2": ("Pontiac",), "5Y2": ("Pontiac",),
+    "6G2": ("Pontiac",), "1GM": ("Pontiac",),
+    "1G8": ("Saturn",), "5GZ": ("Saturn",),
+    "5GR": ("Hummer",), "5GT": ("Hummer",), "137": ("Hummer",),
+    "1Y1": ("Geo",), "2C1": ("Geo",),
+    "KLA": ("Daewoo",),
+    # Chrysler group
+    "1B3": ("Dodge and Ram",), "1B4": ("Dodge and Ram",), "1B7": ("Dodge and Ram",),
+    "2B3": ("Dodge and Ram",), "2B4": ("Dodge and Ram",), "2B7": ("Dodge and Ram",),
+    "3B7": ("Dodge and Ram",), "1D3": ("Dodge and Ram",), "1D4": ("Dodge and Ram",),
+    "1D7": ("Dodge and Ram",), "2D4": ("Dodge and Ram",), "2D8": ("Dodge and Ram",),
+    "3D4": ("Dodge and Ram",), "3D7": ("Dodge and Ram",), "1C6": ("Dodge and Ram",),
+    "3C6": ("Dodge and Ram",), "3C7": ("Dodge and Ram",),
+    "1C3": ("Chrysler", "Dodge and Ram", "SRT"), "2C3": ("Chrysler", "Dodge and Ram"),
+    "1C4": ("Jeep", "Dodge and Ram", "Chrysler"), "2C4": ("Chrysler", "Dodge and Ram"),
+    "3C4": ("Chrysler", "Dodge and Ram"), "1A4": ("Chrysler",), "2A4": ("Chrysler",),
+    "2A8": ("Chrysler",), "1A8": ("Chrysler",), "2C8": ("Chrysler",),
+    "3C3": ("Fiat", "Chrysler"),
+    "1J4": ("Jeep",), "1J8": ("Jeep",),
+    "1P3": ("Plymouth",), "1P4": ("Plymouth",), "2P4": ("Plymouth",), "3P3": ("Plymouth",),
+    "2E3": ("Eagle",), "4E3": ("Eagle",),
+    # Ford / Lincoln / Mercury
+    "1FA": ("Ford",), "1FB": ("Ford",), "1FC": ("Ford",), "1FD": ("Ford",),
+    "1FM": ("Ford",), "1FT": ("Ford",), "2FA": ("Ford",), "2FM": ("Ford",),
+    "2FT": ("Ford",), "3FA": ("Ford",), "3FM": ("Ford",), "3FT": ("Ford",),
+    "1ZV": ("Ford",), "NM0": ("Ford",),
+    "1LN": ("Lincoln",), "2LM": ("Lincoln",), "3LN": ("Lincoln",), "5LM": ("Lincoln",),
+    "1ME": ("Mercury",), "2ME": ("Mercury",), "3ME": ("Mercury",), "4M2": ("Mercury",),
+    # Hyundai / Kia
+    "KMH": ("Hyundai",), "KM8": ("Hyundai",), "5NP": ("Hyundai",), "5NM": ("Hyundai",),
+    "KNA": ("Kia",), "KND": ("Kia",), "5XY": ("Kia",), "5XX": ("Kia",),
+    # Nissan / Infiniti / UD
+    "JN1": ("Nissan-Datsun",), "JN6": ("Nissan-Datsun",), "JN8": ("Nissan-Datsun",),
+    "1N4": ("Nissan-Datsun",), "1N6": ("Nissan-Datsun",), "3N1": ("Nissan-Datsun",),
+    "3N6": ("Nissan-Datsun",), "4N2": ("Nissan-Datsun",), "5N1": ("Nissan-Datsun",),
+    "JNK": ("Infiniti",), "JNR": ("Infiniti",), "5N3": ("Infiniti",),
+    "JNA": ("UD",),
+    # Toyota / Lexus / Scion
+    "JT2": ("Toyota",), "JT3": ("Toyota",), "JT4": ("Toyota",), "JTD": ("Toyota",),
+    "JTE": ("Toyota",), "JTM": ("Toyota",), "JTN": ("Toyota",), "1NX": ("Toyota",),
+    "2T1": ("Toyota",), "2T3": ("Toyota",), "4T1": ("Toyota",), "4T3": ("Toyota",),
+    "5TD": ("Toyota",), "5TE": ("Toyota",), "5TF": ("Toyota",), "5TB": ("Toyota",),
+    "JTH": ("Lexus",), "JTJ": ("Lexus",), "2T2": ("Lexus",), "58A": ("Lexus",),
+    "JTK": ("Scion",), "JTL": ("Scion",),
+    # Other Japanese makes
+    "JM1": ("Mazda",), "JM3": ("Mazda",), "1YV": ("Mazda",), "4F2": ("Mazda",),
+    "4F4": ("Mazda",),
+    "JA3": ("Mitsubishi",), "JA4": ("Mitsubishi",), "4A3": ("Mitsubishi",),
+    "4A4": ("Mitsubishi",),
+    "JF1": ("Subaru",), "JF2": ("Subaru",), "4S3": ("Subaru",), "4S4": ("Subaru",),
+    "JS2": ("Suzuki",), "JS3": ("Suzuki",), "2S2": ("Suzuki",), "2S3": ("Suzuki",),
+    "KL5": ("Suzuki",),
+    "JAA": ("Isuzu",), "JAC": ("Isuzu",), "JAL": ("Isuzu",), "4S2": ("Isuzu",),
+    "JDA": ("Daihatsu",),
+    # European makes
+    "WDB": ("Mercedes Benz",), "WDC": ("Mercedes Benz",), "WDD": ("Mercedes Benz",),
+    "4JG": ("Mercedes Benz",), "55S": ("Mercedes Benz",),
+    "WME": ("Smart",),
+    "SAJ": ("Jaguar",), "SAL": ("Land Rover",),
+    "YV1": ("Volvo",), "YV4": ("Volvo",),
+    "YS3": ("Saab",), "5S3": ("Saab",),
+    "ZFA": ("Fiat",), "VF3": ("Peugeot",), "VF1": ("Renault",), "VX1": ("Yugo",),
+    # Trucks and chassis
+    "1FU": ("Freightliner",), "1FV": ("Freightliner",), "4UZ": ("Freightliner",),
+    "5B4": ("Workhorse",),
+}
+
+# Vehicle descriptor section (positions 4-8) patterns that name a model
+# line, as (WMI pattern, VDS pattern, model). The model only seeds ranking,
+# so the line name is enough. First match wins.
+VDS: List[Tuple[str, str, str]] = [
+    # Honda
+    (r"1HG|2HG", r"C[GMPR]", "Accord"),
+    (r"1HG|2HG|19X|JHM", r"E[GJMS]|F[ABG]", "Civic"),
+    (r"JHM", r"G[DE]", "Fit"),
+    (r"5FN", r"RL", "Odyssey"),
+    (r"5FN|2HK", r"YF", "Pilot"),
+    (r"JHL|5J6|2HK", r"R[DEM]", "CR-V"),
+    # Toyota
+    (r"4T1|JT2", r"[BS][EFGK]", "Camry"),
+    (r"1NX|2T1", r"BR", "Corolla"),
+    (r"JTD", r"K[BN]", "Prius"),
+    (r"5TE", r"", "Tacoma"),
+    # Ford
+    (r"1FA", r"[FD]P4", "Mustang"),
+    (r"1FA|3FA", r"[FHD]P3", "Focus"),
+    (r"1FA", r"FP5", "Taurus"),
+    (r"1FT", r"[RPFE]W", "F 150 Super Crew"),
+    (r"1FT", r"[RPFE]X", "F 150"),
+    (r"1FM", r"[EZ]U", "Explorer"),
+    (r"1FM", r"CU", "Escape"),
+    (r"1FM", r"[PRFJ]U", "Expedition"),
+    # Chevrolet
+    (r"1G1", r"J[CFS]", "Cavalier"),
+    (r"1G1", r"Z[THS]|N[DE]", "Malibu"),
+    (r"1G1", r"YY", "Corvette"),
+    (r"2G1", r"F[PE]", "Camaro"),
+    (r"2G1", r"W[FHTB]", "Impala"),
+    (r"2G1", r"W[WX]", "Monte Carlo"),
+    (r"[123]GC", r"E[CK]|R[CK]|V[CK]", "Silverado 1500"),
+    (r"1GN", r"[DE][ST]", "TrailBlazer"),
+    # Jeep
+    (r"1J[48]", r"G[WX]|[HR][RS]", "Grand Cherokee"),
+    (r"1J[48]", r"F[FJ]", "Cherokee"),
+    (r"1J[48]", r"FA|[BG]A", "Wrangler"),
+    (r"1J[48]", r"G[KL]|PN", "Liberty"),
+    # Nissan
+    (r"1N4", r"[ABD]L", "Altima"),
+    (r"3N1", r"CB|AB", "Sentra"),
+    (r"3N1", r"BC|CN", "Versa"),
+    (r"1N6", r"AD", "Frontier"),
+    (r"1N6", r"BA", "Titan"),
+    (r"5N1", r"AR", "Pathfinder"),
+    (r"5N1", r"AN", "Xterra"),
+    (r"JN8", r"AZ", "Murano"),
+    (r"JN8", r"AS", "Rogue"),
+    # Dodge
+    (r"1B3", r"E[LS]", "Neon"),
+    (r"1D7|3D7", r"H[AU]", "RAM 1500 Truck"),
+    (r"1B7", r"H[CF]", "1500 Pickup"),
+    (r"1B4|1D4", r"H[BDS]", "Durango"),
+    (r"[12][BD]4", r"GP", "Grand Caravan"),
+    (r"2B3", r"KA", "Charger"),
+]
+_VDS = [(re.compile(wmi), re.compile(vds), model) for wmi, vds, model in VDS]
+
+
+def normalize_vin(vin: str) -> str:
+    """Upper-case `vin` and drop spaces and dashes; raises ValueError if it is not a VIN."""
+    vin = re.sub(r"[\s-]+", "", vin).upper()
+    if len(vin) != 17:
+        raise ValueError(f"VIN must be 17 characters, got {len(vin)}: {vin!r}")
+    bad = sorted(set(vin) - set(_TRANSLITERATION))
+    if bad:
+        raise ValueError(f"VIN {vin!r} contains invalid characters: {''.join(bad)}")
+    return vin
+
+
+def check_digit(vin: str) -> str:
+    total = sum(_TRANSLITERATION[c] * w for c, w in zip(vin, _WEIGHTS))
+    remainder = total % 11
+    return "X" if remainder == 10 else str(remainder)
+
+
+def model_year(vin: str) -> Optional[int]:
+    """
+    Model year from position 10. North American VINs disambiguate the 30-year
+    cycle with position 7: a letter there means 2010 or later.
+    """
+    index = MODEL_YEAR_CODES.find(vin[9])
+    if index < 0:
+        return None
+    year = 1980 + index
+    if vin[6].isalpha():
+        year += 30
+    return year
+
+
+def decode_vin(vin: str) -> Dict:
+    """
+    Decode what the tables know about `vin`: candidate manifest makes, the
+    model year, a model-line hint from the VDS and whether the check digit
+    matches (it is only mandatory on North American VINs).
+    """
+    vin = normalize_vin(vin)
+    model = next((name for wmi, vds, name in _VDS
+                  if wmi.fullmatch(vin[:3]) and vds.match(vin[3:8])), None)
+
+    return {
+        "vin": vin,
+        "wmi": vin[:3],
+        "makes": list(WMI.get(vin[:3], ())),
+        "year": model_year(vin),
+        "model": model,
+        "check_digit_ok": vin[8] == check_digit(vin),
+    }
+
+
+def find_vin(text: str) -> Optional[str]:
+    """The first VIN in free text whose check digit matches, if any."""
+    for match in _VIN_RE.finditer(text.upper()):
+        vin = match.group()
+        if vin[8] == check_digit(vin):
+            return vin
+    return None
+
+
+def manifest_vehicle(vin: str) -> Optional[Dict]:
+    """
+    `vin` mapped onto manifest keys: the decoded make the catalog has bundles
+    for in the decoded year (make, year and the VDS model hint, which may be
+    None), or None when the WMI is unknown or the manifest has no such year.
+    """
+    from auto_mechanic_agent.tools.catalog import vehicle_catalog
+
+    decoded = decode_vin(vin)
+    catalog = vehicle_catalog()
+    for make in decoded["makes"]:
+        if decoded["year"] and catalog.has(make, decoded["year"]):
+            return {"make": make, "year": decoded["year"], "model": decoded["model"],
+                    "vin": decoded["vin"]}
+    return None
@@ -1,6 +1,11 @@
 #!/usr/bin/env python3
+import argparse
 import csv
+import os
+import shutil
 import sys
+import tempfile
+import time
 from pathlib import Path
 import duckdb
 
@@ -9,22 +14,95 @@ ROOT     = Path(__file__).resolve().parent
 CSV_PATH = ROOT / "charm_manifest.csv"
 DB_PATH  = ROOT / "knowledge" / "manuals.duckdb"
 
-def setup_database(csv_path: Path, db_path: Path):
-    # ensure output folder exists
-    db_path.parent.mkdir(parents=True, exist_ok=True)
+# Column layout shared by the CSV, Parquet and Arrow sources
+MANIFEST_COLUMNS = ["make", "model", "year", "bundle_url"]
 
-    # check CSV exists
-    if not csv_path.exists():
-        print(f"Error: cannot find {csv_path}", file=sys.stderr)
-        sys.exit(1)
+ARROW_SUFFIXES = (".arrow", ".feather", ".ipc")
 
-    # connect to DuckDB
-    conn = duckdb.connect(str(db_path))
+# Content hash over every manifest column; used to diff incremental refreshes
+ROW_HASH_SQL = "md5(concat_ws('|', make, model, year, bundle_url))"
 
-    # drop & recreate table
-    conn.execute("DROP TABLE IF EXISTS manifest")
+# Rows are identified by their bundle: (make, model, year) is not unique in
+# the scraped data (e.g. NSX and NSX-T both list "V6-3.0L DOHC (VTEC)").
+ROW_KEY = ["make", "year", "bundle_url"]
+
+
+# Lowercased, punctuation-free form of a model name ("Civic DX Coupe L4-1668cc"
+# -> "civic dx coupe l4 1668cc"). QueryManifestTool normalizes its input the
+# same way so lookups are a plain substring test on this column.
+SEARCH_KEY_SQL = "trim(regexp_replace(lower({text}), '[^a-z0-9]+', ' ', 'g'))"
+
+# Distinct character trigrams of a search key, padded so word starts weigh more
+# ("civic" -> "  c", " ci", "civ", "ivi", "vic", "ic ").
+TRIGRAMS_SQL = ("list_distinct([substr('  ' || {key} || ' ', i, 3) "
+                "for i in range(1, length({key}) + 2)])")
+
+# Spellings people (and LLMs) use for charm.li's make names, as search keys.
+# Each make's own key and the parts of compound names ("Dodge and Ram",
+# "Nissan-Datsun") are added automatically when the table is built.
+MAKE_ALIASES = {
+    "chevy": "Chevrolet", "caddy": "Cadillac", "olds": "Oldsmobile",
+    "vw": "Volkswagen", "volkswagon": "Volkswagen",
+    "mercedes": "Mercedes Benz", "benz": "Mercedes Benz",
+    "landrover": "Land Rover", "range rover": "Land Rover",
+    "mini cooper": "Mini", "infinity": "Infiniti", "porshe": "Porsche",
+    "ud trucks": "UD", "nissan diesel": "UD",
+}
+
+# Model synonyms per make, as search-key phrases. Joined and split forms of
+# letter/number names ("f150" / "f 150", "rav 4" / "rav4") are derived from
+# the manifest itself; these are the ones no rule can guess.
+MODEL_ALIASES = {
+    "Chevrolet":     {"vette": "corvette", "trail blazer": "trailblazer"},
+    "Ford":          {"supercrew": "super crew", "crown vic": "crown victoria",
+                      "t bird": "thunderbird"},
+    "Honda":         {"s2k": "s2000"},
+    "Mazda":         {"miata": "mx 5 miata", "mazda2": "2", "mazda3": "3",
+                      "mazda5": "5", "mazda6": "6"},
+    "Nissan-Datsun": {"hardbody": "d21 hardbody"},
+    "Toyota":        {"land cruiser": "landcruiser"},
+}
+
+# Typed manifest columns. `model` keeps the text scraped from charm.li; the
+# engine attributes are parsed from the bundle's own path segment, which
+# always carries the full model name (the scraped text sometimes drops it).
+_MODEL_NAME = r"url_decode(regexp_extract(bundle_url, '/([^/]+)/?$', 1))"
+_LAYOUT_RE  = r"(?:^|\s)([A-Z]{1,2}\d{1,2}|\dRTR|ELE)-"
+
+TYPED_SELECT = rf"""
+    make::make_name                                                AS make,
+    model,
+    TRY_CAST(year AS INTEGER)                                      AS year,
+    bundle_url,
+    coalesce(nullif(trim(regexp_extract({_MODEL_NAME},
+             '^(.*?)' || '{_LAYOUT_RE}', 1)), ''), {_MODEL_NAME})   AS base_model,
+    nullif(regexp_extract({_MODEL_NAME}, '{_LAYOUT_RE}', 1), '')   AS engine_layout,
+    TRY_CAST(nullif(regexp_extract({_MODEL_NAME},
+             '(\d+)\s*cc\b', 1), '') AS INTEGER)                   AS engine_cc,
+    coalesce(TRY_CAST(nullif(regexp_extract({_MODEL_NAME},
+             '(\d+\.\d+)L\b', 1), '') AS DECIMAL(4, 2)),
+             round(engine_cc / 1000, 1))                           AS engine_liters,
+    nullif(regexp_extract({_MODEL_NAME}, '\b(DOHC|SOHC|OHV)\b', 1), '') AS cam,
+    nullif(array_to_string(list_sort(list_distinct(regexp_extract_all({_MODEL_NAME},
+           '\b(Turbo|Supercharged|MFI|SFI|PFI|TBI|CFI|EFI|GDI|FI|\d-bbl)\b'))),
+           ' '), '')                                               AS induction,
+    {SEARCH_KEY_SQL.format(text=_MODEL_NAME)}                      AS model_key,
+    {SEARCH_KEY_SQL.format(text="base_model")}                     AS base_key,
+    {ROW_HASH_SQL}                                                 AS row_hash
+"""
+
+
+def _is_node(url: str = "bundle_url") -> str:
+    """
+    The scraper also emits one row per /Make/Year/ index page (model == year).
+    Those are hierarchy nodes, not manuals, and are kept out of `manifest`.
+    """
+    return rf"regexp_matches({url}, '/bundle/[^/]+/\d+/?$')"
+
+
+def _create_raw(conn):
     conn.execute("""
-        CREATE TABLE manifest (
+        CREATE OR REPLACE TEMP TABLE manifest_raw (
             make        TEXT,
             model       TEXT,
             year        TEXT,
@@ -32,23 +110,456 @@ def setup_database(csv_path: Path, db_path: Path):
         );
     """)
 
-    # insert rows
+
+def _insert_rows(conn, csv_path: Path) -> int:
+    """Legacy path: one INSERT per CSV row. Kept for timing comparisons."""
+    _create_raw(conn)
+
     inserted = 0
     with open(csv_path, newline='', encoding='utf-8') as f:
         reader = csv.DictReader(f)
         for row in reader:
             try:
                 conn.execute(
-                    "INSERT INTO manifest VALUES (?, ?, ?, ?)",
+                    "INSERT INTO manifest_raw VALUES (?, ?, ?, ?)",
                     [row["make"], row["model"], row["year"], row["bundle_url"]]
                 )
                 inserted += 1
             except Exception as e:
                 print(f"[WARN] could not insert {row}: {e}", file=sys.stderr)
+    return inserted
+
+
+def _load_raw(conn, source) -> int:
+    """
+    Load `source` into the TEXT-only `manifest_raw` temp table in a single
+    vectorized scan.
+
+    `source` may be a path to a .csv, .parquet or Arrow IPC (.arrow/.feather)
+    file, or an in-memory pyarrow Table. Malformed CSV lines are skipped and
+    reported on stderr instead of aborting the load.
+    """
+    cols = ", ".join(f"CAST({c} AS TEXT) AS {c}" for c in MANIFEST_COLUMNS)
+
+    if not isinstance(source, (str, Path)):
+        # in-memory Arrow table (or anything DuckDB can register)
+        conn.register("_manifest_source", source)
+        conn.execute(f"CREATE OR REPLACE TEMP TABLE manifest_raw AS "
+                     f"SELECT {cols} FROM _manifest_source")
+        conn.unregister("_manifest_source")
+        return conn.execute("SELECT count(*) FROM manifest_raw").fetchone()[0]
+
+    source = Path(source)
+    suffix = source.suffix.lower()
+
+    if suffix in ARROW_SUFFIXES:
+        import pyarrow.feather as feather
+        return _load_raw(conn, feather.read_table(str(source)))
+
+    if suffix == ".parquet":
+        conn.execute(f"CREATE OR REPLACE TEMP TABLE manifest_raw AS "
+                     f"SELECT {cols} FROM read_parquet(?)", [str(source)])
+        return conn.execute("SELECT count(*) FROM manifest_raw").fetchone()[0]
+
+    types = ", ".join(f"'{c}': 'VARCHAR'" for c in MANIFEST_COLUMNS)
+    conn.execute(f"""
+        CREATE OR REPLACE TEMP TABLE manifest_raw AS
+        SELECT {cols}
+          FROM read_csv(?, header = true, columns = {{{types}}},
+                        store_rejects = true)
+    """, [str(source)])
+
+    for line, csv_line, message in conn.execute(
+        "SELECT line, csv_line, error_message FROM reject_errors ORDER BY line"
+    ).fetchall():
+        print(f"[WARN] could not insert line {line} {csv_line!r}: {message}",
+              file=sys.stderr)
+    conn.execute("DELETE FROM reject_errors")
+
+    return conn.execute("SELECT count(*) FROM manifest_raw").fetchone()[0]
+
+
+def _build_typed(conn, table: str):
+    """
+    Split `manifest_raw` into the `manifest_nodes` hierarchy and the typed
+    leaf rows, written as `table`.
+    """
+    conn.execute(f"""
+        CREATE OR REPLACE TABLE manifest_nodes AS
+        SELECT n.make::make_name AS make,
+               TRY_CAST(n.year AS INTEGER) AS year,
+               n.bundle_url,
+               count(l.bundle_url)::INTEGER AS models
+          FROM manifest_raw n
+          LEFT JOIN manifest_raw l
+            ON l.make = n.make AND l.year = n.year AND NOT {_is_node("l.bundle_url")}
+         WHERE {_is_node("n.bundle_url")}
+         GROUP BY ALL
+         ORDER BY make, year
+    """)
+    # sorted on the lookup columns so DuckDB's zone maps can skip row groups
+    conn.execute(f"""
+        CREATE OR REPLACE TABLE {table} AS
+        SELECT {TYPED_SELECT} FROM manifest_raw
+         WHERE NOT {_is_node()}
+         ORDER BY make, year, model_key
+    """)
+    conn.execute("DROP TABLE manifest_raw")
+
+
+def _build_model_trigrams(conn):
+    """
+    Trigram index over each make's distinct base model names, used by
+    auto_mechanic_agent.tools.model_match to rank fuzzy model matches.
+    """
+    conn.execute(f"""
+        CREATE OR REPLACE TABLE model_trigrams AS
+        WITH names AS (
+            SELECT DISTINCT make, base_key,
+                   {TRIGRAMS_SQL.format(key="base_key")} AS grams
+              FROM manifest
+        )
+        SELECT make, base_key, unnest(grams) AS trigram, len(grams)::INTEGER AS grams
+          FROM names
+         ORDER BY trigram
+    """)
+
+
+def _build_model_family(conn):
+    """
+    `model_family`: one row per contiguous run of years in which a make sold
+    the same normalized model (model_key), e.g. Honda "civic dx coupe l4
+    1590cc" 1996-2000. auto_mechanic_agent.tools.model_family queries it.
+    """
+    conn.execute(f"""
+        CREATE OR REPLACE TABLE model_family AS
+        WITH years AS (
+            SELECT DISTINCT make, base_key, model_key, year, {_MODEL_NAME} AS name
+              FROM manifest
+        ),
+        islands AS (
+            -- consecutive years share year - dense_rank(year)
+            SELECT *, year - dense_rank() OVER (PARTITION BY make, model_key ORDER BY year) AS island
+              FROM years
+        )
+        SELECT make, base_key, model_key, arg_max(name, year) AS name,
+               min(year) AS first_year, max(year) AS last_year,
+               count(DISTINCT year)::INTEGER AS years
+          FROM islands
+         GROUP BY make, base_key, model_key, island
+         ORDER BY make, model_key, first_year
+    """)
+
+
+def _build_aliases(conn):
+    """
+    `make_aliases` (alias -> make) and `model_aliases` (make, alias ->
+    canonical phrase), all as search keys, for makes present in `manifest`.
+    auto_mechanic_agent.tools.aliases applies them before every lookup.
+    """
+    conn.execute("CREATE OR REPLACE TEMP TABLE curated_makes (alias VARCHAR, make VARCHAR)")
+    conn.executemany("INSERT INTO curated_makes VALUES (?, ?)", list(MAKE_ALIASES.items()))
+    conn.execute("CREATE OR REPLACE TEMP TABLE curated_models "
+                 "(make VARCHAR, alias VARCHAR, canonical VARCHAR)")
+    conn.executemany("INSERT INTO curated_models VALUES (?, ?, ?)", [
+        (make, alias, canonical)
+        for make, synonyms in MODEL_ALIASES.items()
+        for alias, canonical in synonyms.items()
+    ])
+
+    conn.execute(rf"""
+        CREATE OR REPLACE TABLE make_aliases AS
+        WITH makes AS (SELECT DISTINCT make::TEXT AS make FROM manifest),
+        derived AS (
+            SELECT {SEARCH_KEY_SQL.format(text="make")} AS alias, make FROM makes
+            UNION
+            SELECT {SEARCH_KEY_SQL.format(text="part")}, make
+              FROM (SELECT make, unnest(regexp_split_to_array(make, '\s+and\s+|-')) AS part
+                      FROM makes)
+        )
+        SELECT alias, min(make) AS make
+          FROM (SELECT alias, make FROM curated_makes UNION SELECT * FROM derived)
+          JOIN makes USING (make)
+         WHERE alias <> ''
+         GROUP BY alias
+         ORDER BY alias
+    """)
+
+    # Derived model aliases: "f 150" is also typed "f150", "rav4" also
+    # "rav 4". An alias that is itself a word or word pair of one of the
+    # make's names is left alone.
+    conn.execute(r"""
+        CREATE OR REPLACE TABLE model_aliases AS
+        WITH names AS (
+            SELECT DISTINCT make, string_split(base_key, ' ') AS words FROM manifest
+        ),
+        words AS (SELECT DISTINCT make, unnest(words) AS phrase FROM names),
+        pairs AS (
+            SELECT DISTINCT make,
+                   unnest([words[i] || ' ' || words[i + 1]
+                           for i in range(1, len(words))]) AS phrase
+              FROM names
+        ),
+        derived AS (
+            SELECT make, replace(phrase, ' ', '') AS alias, phrase AS canonical
+              FROM pairs
+             WHERE regexp_full_match(phrase, '[a-z]{1,3} [0-9]+|[a-z]{1,2} [a-z]|[0-9] [a-z]+')
+            UNION
+            SELECT make, regexp_replace(phrase, '^([a-z]+)([0-9]+)$|^([0-9]+)([a-z]+)$',
+                                        '\1\3 \2\4') AS alias, phrase AS canonical
+              FROM words
+             WHERE regexp_full_match(phrase, '[a-z]+[0-9]+|[0-9]+[a-z]+')
+        ),
+        candidates AS (
+            SELECT make::TEXT AS make, alias, canonical, 1 AS rank FROM derived
+             WHERE (make, alias) NOT IN (SELECT (make, phrase) FROM words)
+               AND (make, alias) NOT IN (SELECT (make, phrase) FROM pairs)
+            UNION ALL
+            SELECT make, alias, canonical, 0 FROM curated_models
+        )
+        SELECT make::make_name AS make, alias, arg_min(canonical, (rank, canonical)) AS canonical
+          FROM candidates
+         WHERE make IN (SELECT DISTINCT make::TEXT FROM manifest)
+         GROUP BY make, alias
+         ORDER BY make, alias
+    """)
+    conn.execute("DROP TABLE curated_makes")
+    conn.execute("DROP TABLE curated_models")
+
+
+def _build_derived(conn):
+    """Rebuild the lookup structures derived from `manifest`."""
+    _build_model_trigrams(conn)
+    _build_model_family(conn)
+    _build_aliases(conn)
+
+
+def _replace_manifest(conn):
+    """Rebuild `manifest` (and its make ENUM) from `manifest_raw`."""
+    conn.execute("DROP TABLE IF EXISTS manifest")
+    conn.execute("DROP TYPE IF EXISTS make_name")
+    conn.execute("""
+        CREATE TYPE make_name AS ENUM (
+            SELECT DISTINCT make FROM manifest_raw
+             WHERE make IS NOT NULL ORDER BY make
+        )
+    """)
+    _build_typed(conn, "manifest")
+    conn.execute("CREATE INDEX manifest_make_year ON manifest (make, year)")
+
+
+def _manifest_count(conn) -> int:
+    return conn.execute("SELECT count(*) FROM manifest").fetchone()[0]
+
+
+def load_source(conn, source) -> int:
+    """Replace `manifest` with the typed contents of `source`."""
+    _load_raw(conn, source)
+    _replace_manifest(conn)
+    return _manifest_count(conn)
+
+
+def _unknown_makes(conn) -> list:
+    """Makes in `manifest_raw` that the existing make ENUM cannot hold."""
+    return [r[0] for r in conn.execute("""
+        SELECT DISTINCT make FROM manifest_raw
+         WHERE make IS NOT NULL
+           AND NOT list_contains(enum_range(NULL::make_name)::TEXT[], make)
+    """).fetchall()]
+
+
+def _schema_current(conn) -> bool:
+    """Whether the existing manifest has the columns this script writes."""
+    expected = conn.execute(f"DESCRIBE SELECT {TYPED_SELECT} FROM manifest_raw").fetchall()
+    actual = conn.execute("DESCRIBE manifest").fetchall()
+    return [c[:2] for c in expected] == [c[:2] for c in actual]
+
+
+def apply_incremental(conn, source):
+    """
+    Diff `source` against the existing manifest by row hash and apply only
+    the inserts, updates and deletes. The affected keys are written to
+    `manifest_changes` so downstream caches can invalidate per row.
+
+    Returns None without touching `manifest` when the source introduces a
+    make the ENUM does not know about, or the manifest was written with an
+    older column layout; the caller then rebuilds in full.
+    """
+    _load_raw(conn, source)
+    if _unknown_makes(conn) or not _schema_current(conn):
+        return None
+    _build_typed(conn, "manifest_staging")
+
+    key_join = " AND ".join(f"s.{k} = m.{k}" for k in ROW_KEY)
+    conn.execute(f"""
+        CREATE OR REPLACE TABLE manifest_changes AS
+        SELECT 'insert' AS op, s.make, s.model, s.year, s.bundle_url
+          FROM manifest_staging s ANTI JOIN manifest m ON {key_join}
+        UNION ALL
+        SELECT 'update', s.make, s.model, s.year, s.bundle_url
+          FROM manifest_staging s JOIN manifest m ON {key_join}
+         WHERE s.row_hash IS DISTINCT FROM m.row_hash
+        UNION ALL
+        SELECT 'delete', m.make, m.model, m.year, m.bundle_url
+          FROM manifest m ANTI JOIN manifest_staging s ON {key_join}
+    """)
+
+    keys = ", ".join(ROW_KEY)
+    conn.execute("BEGIN TRANSACTION")
+    conn.execute(f"""
+        DELETE FROM manifest
+         WHERE ({keys}) IN (SELECT ({keys}) FROM manifest_changes
+                             WHERE op IN ('update', 'delete'))
+    """)
+    conn.execute(f"""
+        INSERT INTO manifest
+        SELECT s.* FROM manifest_staging s
+         WHERE ({", ".join(f"s.{k}" for k in ROW_KEY)}) IN
+               (SELECT ({keys}) FROM manifest_changes WHERE op IN ('insert', 'update'))
+    """)
+    conn.execute("COMMIT")
+    conn.execute("DROP TABLE manifest_staging")
+
+    return dict(conn.execute(
+        "SELECT op, count(*) FROM manifest_changes GROUP BY op"
+    ).fetchall())
+
+
+def _has_hashed_manifest(conn) -> bool:
+    return bool(conn.execute("""
+        SELECT 1 FROM information_schema.columns
+         WHERE table_name = 'manifest' AND column_name = 'row_hash'
+    """).fetchone())
+
+
+def _generation_path(db_path: Path, tag: str) -> Path:
+    """Sibling file holding the shadow ("next") or previous ("prev") generation."""
+    return db_path.with_name(f"{db_path.name}.{tag}")
+
+
+def _keep_generation(src: Path, dst: Path):
+    """Make `dst` a snapshot of `src` without ever removing `src`."""
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
 
+
+def _swap_in(shadow: Path, db_path: Path):
+    """
+    Atomically replace the live database with the finished shadow file.
+    The old file is kept as the previous generation for rollback_database.
+    Readers that already have the old file open keep reading it; new
+    connections see the new generation. There is no window with an empty
+    or missing manifest.
+    """
+    if db_path.exists():
+        _keep_generation(db_path, _generation_path(db_path, "prev"))
+    os.replace(shadow, db_path)
+
+
+def rollback_database(db_path: Path):
+    """Swap the previous generation back in (running it twice rolls forward)."""
+    prev = _generation_path(db_path, "prev")
+    if not prev.exists():
+        print(f"Error: no previous generation at {prev}", file=sys.stderr)
+        sys.exit(1)
+
+    current = _generation_path(db_path, "rollback")
+    _keep_generation(db_path, current)
+    os.replace(prev, db_path)
+    os.replace(current, prev)
+    print(f"Rolled {db_path!r} back to the previous generation")
+
+
+def setup_database(csv_path: Path, db_path: Path, mode: str = "bulk"):
+    # ensure output folder exists
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # check CSV exists
+    if not csv_path.exists():
+        print(f"Error: cannot find {csv_path}", file=sys.stderr)
+        sys.exit(1)
+
+    # build the next generation in a shadow file; the live database is never
+    # locked or modified while we load
+    shadow = _generation_path(db_path, "next")
+    shadow.unlink(missing_ok=True)
+    if mode == "incremental" and db_path.exists():
+        shutil.copy2(db_path, shadow)
+
+    # connect to DuckDB
+    conn = duckdb.connect(str(shadow))
+
+    result = None
+    if mode == "incremental" and _has_hashed_manifest(conn):
+        result = apply_incremental(conn, csv_path)
+        if result is None:
+            print("[INFO] new makes or schema change; rebuilding in full", file=sys.stderr)
+            # the shadow still holds the last run's diff; a full rebuild has no
+            # per-row changes, so leave none behind for caches to trust
+            conn.execute("DROP TABLE IF EXISTS manifest_changes")
+            _replace_manifest(conn)
+            result = _manifest_count(conn)
+            summary = f"Inserted {result} manuals into {db_path!r}"
+        else:
+            summary = (f"Applied {result.get('insert', 0)} inserts, "
+                       f"{result.get('update', 0)} updates, "
+                       f"{result.get('delete', 0)} deletes to {db_path!r}")
+    else:
+        if mode == "rows":
+            _insert_rows(conn, csv_path)
+            _replace_manifest(conn)
+            result = _manifest_count(conn)
+        else:
+            # bulk, or incremental against a database with nothing to diff
+            result = load_source(conn, csv_path)
+        summary = f"Inserted {result} manuals into {db_path!r}"
+
+    _build_derived(conn)
     conn.commit()
     conn.close()
-    print(f"Inserted {inserted} rows into {db_path!r}")
+
+    _swap_in(shadow, db_path)
+    print(summary)
+    return result
+
+
+def timing_report(csv_path: Path):
+    """Rebuild a scratch database with each ingestion mode and print timings."""
+    timings = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in ("rows", "bulk", "incremental"):
+            # incremental re-applies the same CSV on top of the bulk build
+            scratch = Path(tmp) / f"{'bulk' if mode == 'incremental' else mode}.duckdb"
+            start = time.perf_counter()
+            setup_database(csv_path, scratch, mode=mode)
+            timings[mode] = time.perf_counter() - start
+
+    print(f"\n{'mode':<12} {'seconds':>10}")
+    for mode, secs in timings.items():
+        print(f"{mode:<12} {secs:>10.3f}")
+    print(f"speedup: {timings['rows'] / timings['bulk']:.1f}x")
+
 
 if __name__ == "__main__":
-    setup_database(CSV_PATH, DB_PATH)
+    parser = argparse.ArgumentParser(description="Build the manuals DuckDB from the charm.li manifest.")
+    parser.add_argument("source", nargs="?", type=Path, default=CSV_PATH,
+                        help="manifest to ingest (.csv, .parquet, .arrow/.feather)")
+    parser.add_argument("--db", type=Path, default=DB_PATH, help="DuckDB file to write")
+    parser.add_argument("--mode", choices=["bulk", "incremental", "rows"], default="bulk",
+                        help="bulk: one vectorized load; incremental: apply only changed "
+                             "rows; rows: legacy per-row INSERTs")
+    parser.add_argument("--timing", action="store_true",
+                        help="time each mode against scratch databases and exit")
+    parser.add_argument("--rollback", action="store_true",
+                        help="swap the previous database generation back in and exit")
+    args = parser.parse_args()
+
+    if args.rollback:
+        rollback_database(args.db)
+    elif args.timing:
+        timing_report(args.source)
+    else:
+        setup_database(args.source, args.db, mode=args.mode)